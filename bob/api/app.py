@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -24,12 +26,25 @@ from bob.api.routes import (
     routines,
     settings,
 )
+from bob.config import get_config
+from bob.health.refresher import get_lint_refresher
 
 # Path to UI static files
 UI_DIR = Path(__file__).parent.parent / "ui"
 STATIC_DIR = UI_DIR / "static"
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run background refreshers for the lifetime of the server."""
+    refresher = get_lint_refresher()
+    refresher.start(get_config())
+    try:
+        yield
+    finally:
+        refresher.stop()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -43,6 +58,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=_lifespan,
     )
 
     # CORS configuration for local development
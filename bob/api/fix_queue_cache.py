@@ -0,0 +1,66 @@
+"""Short-lived cache of Fix Queue responses shared by routes that change health metrics."""
+
+from __future__ import annotations
+
+import threading
+
+from cachetools import TTLCache
+
+from bob.api.schemas import FixQueueResponse
+from bob.health.refresher import get_lint_refresher
+
+FIX_QUEUE_CACHE_MAXSIZE = 32
+
+# project -> (lint version, response, etag); rebuilt when the configured TTL changes.
+_cache: TTLCache[str | None, tuple[int, FixQueueResponse, str]] | None = None
+_lock = threading.Lock()
+
+
+def get_cached_fix_queue(project: str | None) -> tuple[FixQueueResponse, str] | None:
+    """Return a fresh cached response and ETag for a project, if any.
+
+    Entries built before the latest capture lint scan are treated as misses, so a
+    background rescan after a vault write is picked up without waiting for the TTL.
+    """
+    with _lock:
+        entry = _cache.get(project) if _cache is not None else None
+    if entry is None or entry[0] != get_lint_refresher().version:
+        return None
+    return entry[1], entry[2]
+
+
+def store_fix_queue(
+    project: str | None,
+    response: FixQueueResponse,
+    etag: str,
+    *,
+    lint_version: int,
+    ttl: float,
+) -> None:
+    """Cache a response for ``ttl`` seconds; a non-positive TTL disables caching."""
+    global _cache
+    if ttl <= 0:
+        return
+    with _lock:
+        if _cache is None or _cache.ttl != ttl:
+            _cache = TTLCache(maxsize=FIX_QUEUE_CACHE_MAXSIZE, ttl=ttl)
+        _cache[project] = (lint_version, response, etag)
+
+
+def invalidate_fix_queue_cache() -> None:
+    """Drop cached Fix Queue responses after metrics change."""
+    with _lock:
+        if _cache is not None:
+            _cache.clear()
+
+
+def record_capture_write() -> None:
+    """Refresh capture lint results and drop cached responses after a vault write."""
+    get_lint_refresher().request_refresh()
+    invalidate_fix_queue_cache()
+
+
+def reset_fix_queue_cache() -> None:
+    """Reset the Fix Queue and capture lint caches (for testing)."""
+    invalidate_fix_queue_cache()
+    get_lint_refresher().clear()
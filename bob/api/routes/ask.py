@@ -7,12 +7,16 @@ import time
 import uuid
 from collections.abc import Sequence
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from bob.answer.audit import build_audit_payload
 from bob.answer.constants import NOT_FOUND_MESSAGE
 from bob.api.schemas import AskFooter, AskRequest, AskResponse, CoachSuggestion
-from bob.api.utils import compute_overall_confidence, convert_result_to_source
+from bob.api.utils import (
+    compute_overall_confidence,
+    convert_results_to_sources,
+    model_json_response,
+)
 from bob.coach.engine import generate_coach_suggestions
 from bob.db.database import Database, get_database
 from bob.retrieval.search import search
@@ -54,7 +58,7 @@ def _resolve_coach_mode(
 
 
 @router.post("/ask", response_model=AskResponse)
-def ask_query(request: AskRequest) -> AskResponse:
+def ask_query(request: AskRequest) -> Response:
     """Query the knowledge base and return answer with citations.
 
     Args:
@@ -99,7 +103,7 @@ def ask_query(request: AskRequest) -> AskResponse:
         raise HTTPException(status_code=500, detail=f"Search failed: {e}") from e
 
     # Convert results to sources
-    sources = [convert_result_to_source(result, idx + 1) for idx, result in enumerate(results)]
+    sources = convert_results_to_sources(results)
 
     # Build response
     elapsed_ms = int((time.time() - start_time) * 1000)
@@ -122,22 +126,24 @@ def ask_query(request: AskRequest) -> AskResponse:
             override_cooldown=request.coach_show_anyway,
         )
         _log_suggestions(db, suggestions, project)
-        return AskResponse(
-            answer=None,
-            answer_id=answer_id,
-            coach_mode_enabled=coach_enabled,
-            suggestions=suggestions,
-            sources=[],
-            audit=build_audit_payload([], answer=None),
-            footer=AskFooter(
-                source_count=0,
-                date_confidence=None,
-                may_be_outdated=False,
-                outdated_source_count=0,
-                not_found=True,
-                not_found_message=NOT_FOUND_MESSAGE,
-            ),
-            query_time_ms=elapsed_ms,
+        return model_json_response(
+            AskResponse(
+                answer=None,
+                answer_id=answer_id,
+                coach_mode_enabled=coach_enabled,
+                suggestions=suggestions,
+                sources=[],
+                audit=build_audit_payload([], answer=None),
+                footer=AskFooter(
+                    source_count=0,
+                    date_confidence=None,
+                    may_be_outdated=False,
+                    outdated_source_count=0,
+                    not_found=True,
+                    not_found_message=NOT_FOUND_MESSAGE,
+                ),
+                query_time_ms=elapsed_ms,
+            )
         )
 
     # Build answer from top result
@@ -162,20 +168,22 @@ def ask_query(request: AskRequest) -> AskResponse:
     )
     _log_suggestions(db, suggestions, project)
 
-    return AskResponse(
-        answer=answer,
-        answer_id=answer_id,
-        coach_mode_enabled=coach_enabled,
-        suggestions=suggestions,
-        sources=sources,
-        audit=build_audit_payload(results, answer=answer),
-        footer=AskFooter(
-            source_count=len(sources),
-            date_confidence=overall_confidence,
-            may_be_outdated=any_outdated,
-            outdated_source_count=outdated_count,
-            not_found=False,
-            not_found_message=None,
-        ),
-        query_time_ms=elapsed_ms,
+    return model_json_response(
+        AskResponse(
+            answer=answer,
+            answer_id=answer_id,
+            coach_mode_enabled=coach_enabled,
+            suggestions=suggestions,
+            sources=sources,
+            audit=build_audit_payload(results, answer=answer),
+            footer=AskFooter(
+                source_count=len(sources),
+                date_confidence=overall_confidence,
+                may_be_outdated=any_outdated,
+                outdated_source_count=outdated_count,
+                not_found=False,
+                not_found_message=None,
+            ),
+            query_time_ms=elapsed_ms,
+        )
     )
@@ -9,6 +9,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
+from bob.api.fix_queue_cache import record_capture_write
 from bob.api.schemas import (
     BookmarksImportRequest,
     BookmarksImportResponse,
@@ -230,6 +231,7 @@ def _write_connector_note(
     )
     target_path.parent.mkdir(parents=True, exist_ok=True)
     target_path.write_text(content, encoding="utf-8")
+    record_capture_write()
 
 
 @router.post("/connectors/bookmarks/import", response_model=BookmarksImportResponse)
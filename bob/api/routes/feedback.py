@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
+from bob.api.fix_queue_cache import invalidate_fix_queue_cache
 from bob.api.schemas import FeedbackRequest, FeedbackResponse
 from bob.db.database import get_database
 
@@ -21,4 +22,5 @@ def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
         feedback_reason=request.feedback_reason,
         retrieved_source_ids=request.retrieved_source_ids,
     )
+    invalidate_fix_queue_cache()
     return FeedbackResponse(success=True)
@@ -2,20 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import re
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
 
+from bob.api.fix_queue_cache import get_cached_fix_queue, store_fix_queue
 from bob.api.schemas import FailureSignal, FixQueueResponse, FixQueueTask
 from bob.config import get_config
 from bob.db.database import get_database
-from bob.health.lint import LintIssue, collect_capture_lint_issues
+from bob.health.lint import LintIssue
 from bob.health.priority import priority_from_count, priority_from_ratio, staleness_value
+from bob.health.refresher import get_lint_refresher
 
 router = APIRouter()
 
+_HASH_SEP = b":"
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+_SPACE_TO_DASH = str.maketrans(" ", "-")
+_ENTITY_TAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+ACTION_RUN_ROUTINE = "run_routine"
+ACTION_RUN_QUERY = "run_query"
+ACTION_FIX_METADATA = "fix_metadata"
+ACTION_FIX_CAPTURE = "fix_capture"
+ACTION_OPEN_FILE = "open_file"
+ACTION_OPEN_INDEXING = "open_indexing"
+ACTION_RAISE_SCOPE = "raise_scope"
+ACTION_ALLOW_PATH = "allow_path"
+ACTION_REVIEW_PERMISSIONS = "review_permissions"
+
+REASON_SCOPE = "scope"
+REASON_PATH = "path"
+
+# reason_code -> (action, fixed target or None for the denied path, reason template, priority)
+_PERMISSION_TASK_SPECS: dict[str, tuple[str, str | None, str, int]] = {
+    REASON_SCOPE: (
+        ACTION_RAISE_SCOPE,
+        "permissions.default_scope",
+        "Routine '{action_name}' blocked at scope {scope_level}; "
+        "requires {required_scope} for {target_path}",
+        2,
+    ),
+    REASON_PATH: (
+        ACTION_ALLOW_PATH,
+        None,
+        "Routine '{action_name}' tried to write outside allowed paths: {target_path}",
+        3,
+    ),
+}
+_DEFAULT_PERMISSION_TASK_SPEC = (
+    ACTION_REVIEW_PERMISSIONS,
+    None,
+    "Permission denial for '{action_name}' writing to {target_path}",
+    3,
+)
+
+# Shared read-only default for missing count maps, so lookups never allocate a new dict.
+_EMPTY_COUNTS: Mapping[str, int] = MappingProxyType({})
+
+
+def _short_hash(*parts: bytes) -> str:
+    """Hash pre-encoded ID components into a 10-character hex digest."""
+    return _digest_key(_HASH_SEP.join(parts))
+
+
+def _digest_key(key: bytes) -> str:
+    """Hash an already-joined ID key into a 10-character hex digest."""
+    return hashlib.blake2b(key, digest_size=5).hexdigest()
+
 
 @router.get("/health")
 def health_check() -> dict[str, str | int]:
@@ -45,7 +106,7 @@ def _format_permission_denial_details(metrics: dict[str, Any]) -> str:
     if total == 0:
         return "No permission denials recorded."
 
-    counts = metrics.get("counts", {})
+    counts = metrics.get("counts") or _EMPTY_COUNTS
     window_hours = metrics.get("window_hours")
     scope_count = counts.get("scope", 0)
     path_count = counts.get("path", 0)
@@ -69,37 +130,51 @@ def _format_low_volume_details(projects: list[dict[str, Any]], threshold: int) -
     """Describe low document coverage by project."""
     if not projects:
         return "No projects below minimum document count."
+    if len(projects) == 1:
+        item = projects[0]
+        return (
+            f"1 project under {threshold} docs: "
+            f"{item['project'] or 'unknown'} ({item['document_count']})"
+        )
     preview = ", ".join(
         f"{item['project'] or 'unknown'} ({item['document_count']})" for item in projects[:3]
     )
-    label = "project" if len(projects) == 1 else "projects"
-    return f"{len(projects)} {label} under {threshold} docs: {preview}"
+    return f"{len(projects)} projects under {threshold} docs: {preview}"
 
 
 def _format_low_hit_rate_details(projects: list[dict[str, Any]], threshold: float) -> str:
     """Describe low retrieval hit rates by project."""
     if not projects:
         return "No projects below hit-rate threshold."
+    threshold_label = f"{threshold * 100:.0f}%"
+    if len(projects) == 1:
+        item = projects[0]
+        return (
+            f"1 project below {threshold_label} hit rate: "
+            f"{item['project']} ({item['hit_rate'] * 100:.0f}% hits)"
+        )
     preview = ", ".join(
         f"{item['project']} ({item['hit_rate'] * 100:.0f}% hits)" for item in projects[:3]
     )
-    label = "project" if len(projects) == 1 else "projects"
-    return f"{len(projects)} {label} below {threshold * 100:.0f}% hit rate: {preview}"
+    return f"{len(projects)} projects below {threshold_label} hit rate: {preview}"
 
 
 def _format_metadata_offenders_details(entries: list[dict[str, Any]]) -> str:
     """Describe top metadata offenders by file count."""
     if not entries:
         return "No metadata offenders detected."
+    if len(entries) == 1:
+        return f"Top project: {entries[0]['project']} ({entries[0]['count']})"
     preview = ", ".join(f"{item['project']} ({item['count']})" for item in entries[:3])
-    label = "project" if len(entries) == 1 else "projects"
-    return f"Top {label}: {preview}"
+    return f"Top projects: {preview}"
 
 
 def _format_staleness_details(buckets: list[dict[str, Any]], label: str) -> str:
     """Describe staleness buckets for notes or decisions."""
     if not buckets:
         return f"No {label} staleness data."
+    if len(buckets) == 1:
+        return f"{label} older than {buckets[0]['days']}d+: {buckets[0]['count']}"
     preview = ", ".join(f"{item['days']}d+: {item['count']}" for item in buckets)
     return f"{label} older than {preview}"
 
@@ -109,17 +184,17 @@ def _format_ingestion_error_details(metrics: dict[str, Any]) -> str:
     total = metrics.get("total", 0)
     if total == 0:
         return "No ingestion errors recorded."
-    counts = metrics.get("counts", {})
+    counts = metrics.get("counts") or _EMPTY_COUNTS
     parts: list[str] = []
     for label in ("parse_error", "no_text", "oversize"):
         count = counts.get(label, 0)
         if count:
-            parts.append(f"{label.replace('_', ' ')}: {count}")
+            parts.append(f"{label.translate(_UNDERSCORE_TO_SPACE)}: {count}")
     if not parts and counts:
         for key, count in counts.items():
-            parts.append(f"{str(key).replace('_', ' ')}: {count}")
+            parts.append(f"{str(key).translate(_UNDERSCORE_TO_SPACE)}: {count}")
     detail = ", ".join(parts) if parts else f"{total} ingestion errors logged."
-    recent = metrics.get("recent", [])
+    recent = metrics.get("recent") or ()
     if recent:
         preview = ", ".join(
             Path(item["source_path"]).name for item in recent[:3] if item.get("source_path")
@@ -131,7 +206,7 @@ def _format_ingestion_error_details(metrics: dict[str, Any]) -> str:
 
 def _format_ingestion_task_reason(error_type: str, message: str | None) -> str:
     """Create a user-facing reason string for ingestion failures."""
-    label = error_type.replace("_", " ")
+    label = error_type.translate(_UNDERSCORE_TO_SPACE)
     if message:
         trimmed = message.strip()
         if len(trimmed) > 160:
@@ -155,119 +230,112 @@ def _build_fix_queue_tasks(
     metrics: dict[str, Any],
     metadata_deficits: list[dict[str, Any]],
     project: str | None,
-    permission_denials: list[dict[str, Any]],
-) -> list[FixQueueTask]:
-    """Create Fix Queue tasks from health signals."""
-    tasks: list[FixQueueTask] = []
+    permission_denials: Sequence[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Create raw Fix Queue task payloads from health signals."""
+    tasks: list[dict[str, Any]] = []
     freq = metrics.get("not_found_frequency", 0.0)
     total_feedback = metrics.get("total", 0)
     if freq > 0 and total_feedback > 0:
         project_label = project or "all projects"
-        id_label = (project or "global").replace(" ", "-")
+        id_label = (project or "global").translate(_SPACE_TO_DASH)
         task_id = f"not-found-{id_label}"
         tasks.append(
-            FixQueueTask(
-                id=task_id,
-                action="run_routine",
-                target="routines/daily-checkin",
-                project=project,
-                reason=(
+            {
+                "id": task_id,
+                "action": ACTION_RUN_ROUTINE,
+                "target": "routines/daily-checkin",
+                "project": project,
+                "reason": (
                     f"{freq * 100:.1f}% of feedback entries "
                     f"from {project_label} were 'didn't answer'"
                 ),
-                priority=priority_from_ratio(freq),
-            )
+                "priority": priority_from_ratio(freq),
+            }
         )
 
-    for idx, deficit in enumerate(metadata_deficits, start=1):
-        missing = ", ".join(deficit.get("missing_fields", [])) or "metadata"
-        tasks.append(
-            FixQueueTask(
-                id=f"metadata-{deficit['document_id']}-{idx}",
-                action="fix_metadata",
-                target=deficit["source_path"],
-                project=deficit.get("project") or project,
-                reason=f"Missing metadata fields: {missing}",
-                priority=3,
-            )
-        )
+    tasks.extend(
+        {
+            "id": f"metadata-{deficit['document_id']}",
+            "action": ACTION_FIX_METADATA,
+            "target": deficit["source_path"],
+            "project": deficit.get("project") or project,
+            "reason": (
+                f"Missing metadata fields: {', '.join(deficit.get('missing_fields', [])) or 'metadata'}"
+            ),
+            "priority": 3,
+        }
+        for deficit in metadata_deficits
+    )
 
-    for repeated in metrics.get("repeated_questions", []):
-        hashed = hashlib.sha256(repeated["question"].encode("utf-8")).hexdigest()[:10]
-        repeated_project = repeated.get("project") or project
-        tasks.append(
-            FixQueueTask(
-                id=f"repeat-{hashed}",
-                action="run_query",
-                target=repeated["question"],
-                project=repeated_project,
-                reason=f"Question repeated {repeated['count']} times in the last 48h",
-                priority=priority_from_count(repeated["count"]),
-            )
+    append = tasks.append
+    for repeated in metrics.get("repeated_questions") or ():
+        question = repeated["question"]
+        count = repeated["count"]
+        append(
+            {
+                "id": f"repeat-{_short_hash(question.encode('utf-8'))}",
+                "action": ACTION_RUN_QUERY,
+                "target": question,
+                "project": repeated.get("project") or project,
+                "reason": f"Question repeated {count} times in the last 48h",
+                "priority": priority_from_count(count),
+            }
         )
 
-    seen_permission_tasks: set[tuple[str, str, str]] = set()
+    # The encoded key doubles as the dedupe key and the task ID hash input.
+    seen_permission_tasks: set[bytes] = set()
     for denial in permission_denials:
         reason_code = denial.get("reason_code", "unknown")
         target_path = denial.get("target_path", "unknown")
         action_name = denial.get("action_name", "routine")
-        scope_level = denial.get("scope_level")
-        required_scope = denial.get("required_scope_level")
-        task_key = (reason_code, action_name, target_path)
+        task_key = _HASH_SEP.join(
+            (
+                (reason_code or "").encode("utf-8"),
+                (action_name or "").encode("utf-8"),
+                (target_path or "").encode("utf-8"),
+            )
+        )
         if task_key in seen_permission_tasks:
             continue
         seen_permission_tasks.add(task_key)
 
-        if reason_code == "scope":
-            action = "raise_scope"
-            target = "permissions.default_scope"
-            reason = (
-                f"Routine '{action_name}' blocked at scope {scope_level}; "
-                f"requires {required_scope} for {target_path}"
-            )
-            priority = 2
-        elif reason_code == "path":
-            action = "allow_path"
-            target = target_path
-            reason = f"Routine '{action_name}' tried to write outside allowed paths: {target_path}"
-            priority = 3
-        else:
-            action = "review_permissions"
-            target = target_path
-            reason = f"Permission denial for '{action_name}' writing to {target_path}"
-            priority = 3
-
-        task_id = hashlib.sha256(f"{reason_code}:{action_name}:{target_path}".encode()).hexdigest()[
-            :10
-        ]
-        tasks.append(
-            FixQueueTask(
-                id=f"permission-{task_id}",
-                action=action,
-                target=target,
-                project=denial.get("project") or project,
-                reason=reason,
-                priority=priority,
-            )
+        action, target, template, priority = _PERMISSION_TASK_SPECS.get(
+            reason_code, _DEFAULT_PERMISSION_TASK_SPEC
+        )
+        append(
+            {
+                "id": f"permission-{_digest_key(task_key)}",
+                "action": action,
+                "target": target or target_path,
+                "project": denial.get("project") or project,
+                "reason": template.format(
+                    action_name=action_name,
+                    scope_level=denial.get("scope_level"),
+                    required_scope=denial.get("required_scope_level"),
+                    target_path=target_path,
+                ),
+                "priority": priority,
+            }
         )
 
     return tasks
 
 
-def _build_lint_tasks(lint_issues: list[LintIssue]) -> list[FixQueueTask]:
+def _build_lint_tasks(lint_issues: list[LintIssue]) -> list[dict[str, Any]]:
     """Create Fix Queue tasks from capture lint issues."""
-    tasks: list[FixQueueTask] = []
+    tasks: list[dict[str, Any]] = []
     for issue in lint_issues:
-        task_hash = hashlib.sha256(f"{issue.code}:{issue.file_path}".encode()).hexdigest()[:10]
-        action = "fix_metadata" if issue.code == "missing_metadata" else "fix_capture"
+        task_hash = _short_hash(issue.code.encode("utf-8"), str(issue.file_path).encode("utf-8"))
+        action = ACTION_FIX_METADATA if issue.code == "missing_metadata" else ACTION_FIX_CAPTURE
         tasks.append(
-            FixQueueTask(
-                id=f"lint-{issue.code}-{task_hash}",
-                action=action,
-                target=str(issue.file_path),
-                reason=issue.message,
-                priority=issue.priority,
-            )
+            {
+                "id": f"lint-{issue.code}-{task_hash}",
+                "action": action,
+                "target": str(issue.file_path),
+                "reason": issue.message,
+                "priority": issue.priority,
+            }
         )
     return tasks
 
@@ -276,7 +344,7 @@ def _build_staleness_task(
     stale_notes: list[dict[str, Any]],
     stale_decisions: list[dict[str, Any]],
     project: str | None,
-) -> FixQueueTask | None:
+) -> dict[str, Any] | None:
     """Create a Fix Queue task that prompts a weekly review for stale content."""
     notes_count = staleness_value(stale_notes)
     decisions_count = staleness_value(stale_decisions)
@@ -290,15 +358,15 @@ def _build_staleness_task(
         reasons.append(_format_staleness_details(stale_decisions, "Decisions"))
     reason = " | ".join(reasons) if reasons else "Stale notes or decisions detected."
 
-    task_id = f"stale-review-{(project or 'global').replace(' ', '-')}"
-    return FixQueueTask(
-        id=task_id,
-        action="run_routine",
-        target="routines/weekly-review",
-        project=project,
-        reason=reason,
-        priority=priority_from_count(max(notes_count, decisions_count)),
-    )
+    task_id = f"stale-review-{(project or 'global').translate(_SPACE_TO_DASH)}"
+    return {
+        "id": task_id,
+        "action": ACTION_RUN_ROUTINE,
+        "target": "routines/weekly-review",
+        "project": project,
+        "reason": reason,
+        "priority": priority_from_count(max(notes_count, decisions_count)),
+    }
 
 
 def _build_indexing_tasks(
@@ -307,28 +375,28 @@ def _build_indexing_tasks(
     *,
     low_volume_threshold: int,
     low_hit_rate_threshold: float,
-) -> list[FixQueueTask]:
+) -> list[dict[str, Any]]:
     """Create Fix Queue tasks that prompt indexing for low-coverage projects."""
-    tasks: list[FixQueueTask] = []
+    tasks: list[dict[str, Any]] = []
 
     for item in low_volume_projects:
         project = item.get("project") or "unknown"
         doc_count = int(item.get("document_count", 0))
         gap = max(0, low_volume_threshold - doc_count)
         priority = priority_from_count(gap) if gap else 5
-        task_id = f"index-volume-{project.replace(' ', '-')}"
+        task_id = f"index-volume-{project.translate(_SPACE_TO_DASH)}"
         tasks.append(
-            FixQueueTask(
-                id=task_id,
-                action="open_indexing",
-                target=project,
-                project=project,
-                reason=(
+            {
+                "id": task_id,
+                "action": ACTION_OPEN_INDEXING,
+                "target": project,
+                "project": project,
+                "reason": (
                     f"Project '{project}' has only {doc_count} documents "
                     f"(threshold {low_volume_threshold})."
                 ),
-                priority=priority,
-            )
+                "priority": priority,
+            }
         )
 
     for item in low_hit_rate_projects:
@@ -340,27 +408,27 @@ def _build_indexing_tasks(
             else 0.0
         )
         priority = priority_from_ratio(severity)
-        task_id = f"index-hit-rate-{project.replace(' ', '-')}"
+        task_id = f"index-hit-rate-{project.translate(_SPACE_TO_DASH)}"
         tasks.append(
-            FixQueueTask(
-                id=task_id,
-                action="open_indexing",
-                target=project,
-                project=project,
-                reason=(
+            {
+                "id": task_id,
+                "action": ACTION_OPEN_INDEXING,
+                "target": project,
+                "project": project,
+                "reason": (
                     f"Project '{project}' has {hit_rate * 100:.0f}% retrieval hit rate "
                     f"(threshold {low_hit_rate_threshold * 100:.0f}%)."
                 ),
-                priority=priority,
-            )
+                "priority": priority,
+            }
         )
 
     return tasks
 
 
-def _build_ingestion_tasks(errors: list[dict[str, Any]]) -> list[FixQueueTask]:
+def _build_ingestion_tasks(errors: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     """Create Fix Queue tasks from recent ingestion errors."""
-    tasks: list[FixQueueTask] = []
+    tasks: list[dict[str, Any]] = []
     seen: set[tuple[str, str]] = set()
     for error in errors:
         path = error.get("source_path")
@@ -372,118 +440,124 @@ def _build_ingestion_tasks(errors: list[dict[str, Any]]) -> list[FixQueueTask]:
             continue
         seen.add(key)
         reason = _format_ingestion_task_reason(error_type, error.get("error_message"))
-        task_hash = hashlib.sha256(f"{path}:{error_type}".encode()).hexdigest()[:10]
+        task_hash = _short_hash(path.encode("utf-8"), error_type.encode("utf-8"))
         tasks.append(
-            FixQueueTask(
-                id=f"ingest-{task_hash}",
-                action="open_file",
-                target=path,
-                project=error.get("project"),
-                reason=reason,
-                priority=_priority_for_ingestion_error(error_type),
-            )
+            {
+                "id": f"ingest-{task_hash}",
+                "action": ACTION_OPEN_FILE,
+                "target": path,
+                "project": error.get("project"),
+                "reason": reason,
+                "priority": _priority_for_ingestion_error(error_type),
+            }
         )
     return tasks
 
 
-@router.get("/health/fix-queue", response_model=FixQueueResponse)
-def health_fix_queue(project: str | None = None) -> FixQueueResponse:
-    """Return Fix Queue signals and tasks derived from failure metrics."""
+async def _build_fix_queue_response(project: str | None) -> FixQueueResponse:
+    """Collect health metrics and derive Fix Queue signals and tasks."""
     db = get_database()
     config = get_config()
-    metrics = db.get_feedback_metrics(project=project)
-    metadata_deficits = db.get_documents_missing_metadata(project=project)
-    metadata_total = db.get_missing_metadata_total(project=project)
-    metadata_counts = db.get_missing_metadata_counts(project=project)
-    permission_metrics = db.get_permission_denial_metrics(project=project)
-    lint_issues = collect_capture_lint_issues(config, project=project)
-    project_counts = db.get_project_document_counts(project=project)
-    low_volume_threshold = config.health.low_volume_document_threshold
+    health = config.health
+
+    # The lint walk touches the filesystem only, so it overlaps with the single
+    # bundled read transaction instead of waiting behind it.
+    bundle, lint_issues = await asyncio.gather(
+        asyncio.to_thread(
+            db.get_fix_queue_bundle,
+            project=project,
+            task_limit=health.max_tasks_per_kind,
+            search_window_hours=health.search_window_hours,
+            min_searches=health.min_searches_for_rate,
+            staleness_buckets_days=health.staleness_buckets_days,
+            ingestion_window_hours=health.ingestion_error_window_hours,
+            ingestion_task_limit=health.ingestion_error_task_limit,
+        ),
+        asyncio.to_thread(get_lint_refresher().get, config, project),
+    )
+    metrics = bundle["feedback"]
+    metadata_deficits = bundle["metadata_deficits"]
+    metadata_total = bundle["metadata_total"]
+    metadata_counts = bundle["metadata_counts"]
+    permission_metrics = bundle["permission_denials"]
+    project_counts = bundle["project_counts"]
+    search_stats = bundle["search_stats"]
+    stale_notes = bundle["stale_notes"]
+    stale_decisions = bundle["stale_decisions"]
+    ingestion_metrics = bundle["ingestion_errors"]
+
+    low_volume_threshold = health.low_volume_document_threshold
     low_volume_projects = [
         item for item in project_counts if item["document_count"] < low_volume_threshold
     ]
-    search_stats = db.get_search_history_stats(
-        window_hours=config.health.search_window_hours,
-        min_count=config.health.min_searches_for_rate,
-        project=project,
-    )
-    low_hit_rate_threshold = config.health.low_hit_rate_threshold
+    low_hit_rate_threshold = health.low_hit_rate_threshold
     low_hit_rate_projects = [
         item for item in search_stats if item["hit_rate"] < low_hit_rate_threshold
     ]
-    staleness_buckets = config.health.staleness_buckets_days
-    stale_notes = db.get_stale_document_buckets(
-        buckets_days=staleness_buckets, source_type="markdown", project=project
-    )
-    stale_decisions = db.get_stale_decision_buckets(buckets_days=staleness_buckets, project=project)
-    ingestion_metrics = db.get_ingestion_error_metrics(
-        project=project,
-        window_hours=config.health.ingestion_error_window_hours,
-        limit=config.health.ingestion_error_task_limit,
-    )
 
+    feedback_counts = metrics.get("counts") or _EMPTY_COUNTS
     failure_signals = [
-        FailureSignal(
+        FailureSignal.model_construct(
             name="not_found_frequency",
             value=metrics.get("not_found_frequency", 0.0),
             details=(
-                f"{metrics.get('counts', {}).get('didnt_answer', 0)} of "
+                f"{feedback_counts.get('didnt_answer', 0)} of "
                 f"{metrics.get('total', 0)} feedback entries were 'didn't answer'"
             ),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="metadata_deficits",
             value=metadata_total,
             details="Documents missing source_date/project/language metadata",
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="metadata_top_offenders",
             value=len(metadata_counts),
             details=_format_metadata_offenders_details(metadata_counts),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="stale_notes",
             value=staleness_value(stale_notes),
             details=_format_staleness_details(stale_notes, "Notes"),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="stale_decisions",
             value=staleness_value(stale_decisions),
             details=_format_staleness_details(stale_decisions, "Decisions"),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="ingestion_errors",
             value=ingestion_metrics.get("total", 0),
             details=_format_ingestion_error_details(ingestion_metrics),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="repeated_questions",
-            value=len(metrics.get("repeated_questions", [])),
+            value=len(metrics.get("repeated_questions") or ()),
             details="Repeated queries observed over the past 48 hours",
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="permission_denials",
             value=permission_metrics.get("total", 0),
             details=_format_permission_denial_details(permission_metrics),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="low_indexed_volume",
             value=len(low_volume_projects),
             details=_format_low_volume_details(low_volume_projects, low_volume_threshold),
         ),
-        FailureSignal(
+        FailureSignal.model_construct(
             name="low_retrieval_hit_rate",
             value=len(low_hit_rate_projects),
             details=_format_low_hit_rate_details(low_hit_rate_projects, low_hit_rate_threshold),
         ),
     ]
 
-    tasks = _build_fix_queue_tasks(
-        metrics, metadata_deficits, project, permission_metrics.get("recent", [])
+    raw_tasks = _build_fix_queue_tasks(
+        metrics, metadata_deficits, project, permission_metrics.get("recent") or ()
     )
-    tasks.extend(_build_lint_tasks(lint_issues))
-    tasks.extend(_build_ingestion_tasks(ingestion_metrics.get("recent", [])))
-    tasks.extend(
+    raw_tasks.extend(_build_lint_tasks(lint_issues))
+    raw_tasks.extend(_build_ingestion_tasks(ingestion_metrics.get("recent") or ()))
+    raw_tasks.extend(
         _build_indexing_tasks(
             low_volume_projects,
             low_hit_rate_projects,
@@ -493,5 +567,74 @@ def health_fix_queue(project: str | None = None) -> FixQueueResponse:
     )
     staleness_task = _build_staleness_task(stale_notes, stale_decisions, project)
     if staleness_task:
-        tasks.append(staleness_task)
-    return FixQueueResponse(failure_signals=failure_signals, tasks=tasks)
+        raw_tasks.append(staleness_task)
+    # Signals and tasks come from trusted internal sources, so skip field validation.
+    return FixQueueResponse.model_construct(
+        failure_signals=failure_signals,
+        tasks=[FixQueueTask.model_construct(**task) for task in raw_tasks],
+    )
+
+
+async def _get_fix_queue_response(project: str | None) -> tuple[FixQueueResponse, str]:
+    """Return the Fix Queue response and its ETag, reusing a fresh cached copy."""
+    cached = get_cached_fix_queue(project)
+    if cached is not None:
+        return cached
+
+    # Read the lint version first so a rescan finishing mid-build invalidates this entry.
+    lint_version = get_lint_refresher().version
+    response = await _build_fix_queue_response(project)
+    digest = hashlib.blake2b(response.model_dump_json().encode(), digest_size=16).hexdigest()
+    etag = f'"{digest}"'
+    store_fix_queue(
+        project,
+        response,
+        etag,
+        lint_version=lint_version,
+        ttl=get_config().health.fix_queue_cache_seconds,
+    )
+    return response, etag
+
+
+def _if_none_match(header: str | None, etag: str) -> bool:
+    """Return True when an If-None-Match header matches ``etag``.
+
+    Follows RFC 9110 section 13.1.2: ``*`` matches any current representation,
+    and listed entity tags use weak comparison, so a ``W/`` prefix is ignored.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in _ENTITY_TAG_RE.findall(header)
+
+
+@router.get("/health/fix-queue", response_model=FixQueueResponse)
+async def health_fix_queue(
+    request: Request, response: Response, project: str | None = None
+) -> FixQueueResponse | Response:
+    """Return Fix Queue signals and tasks derived from failure metrics."""
+    payload, etag = await _get_fix_queue_response(project)
+    if _if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return payload
+
+
+def _iter_fix_queue_ndjson(response: FixQueueResponse) -> Iterator[bytes]:
+    """Yield one JSON line per failure signal, then one per task."""
+    for signal in response.failure_signals:
+        yield b'{"type":"failure_signal","data":%s}\n' % signal.model_dump_json().encode()
+    for task in response.tasks:
+        yield b'{"type":"task","data":%s}\n' % task.model_dump_json().encode()
+
+
+@router.get("/health/fix-queue.ndjson")
+async def health_fix_queue_ndjson(project: str | None = None) -> StreamingResponse:
+    """Stream Fix Queue signals and tasks as newline-delimited JSON."""
+    payload, etag = await _get_fix_queue_response(project)
+    return StreamingResponse(
+        _iter_fix_queue_ndjson(payload),
+        media_type="application/x-ndjson",
+        headers={"ETag": etag},
+    )
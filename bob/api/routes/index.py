@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import threading
 import uuid
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
+from bob.api.fix_queue_cache import invalidate_fix_queue_cache
+from bob.api.routes.projects import invalidate_projects_cache
 from bob.api.schemas import (
     IndexAlreadyRunningError,
     IndexError,
@@ -21,16 +23,40 @@ from bob.api.schemas import (
 
 router = APIRouter()
 
+PROGRESS_UPDATE_INTERVAL = 16
+
+
+@dataclass(frozen=True, slots=True)
+class IndexJobSnapshot:
+    """Immutable view of an indexing job.
+
+    The manager replaces the snapshot on every update, so callers can hold on to
+    one without copying it or taking the lock.
+    """
+
+    job_id: str
+    status: str
+    path: str
+    project: str
+    recursive: bool
+    started_at: datetime
+    completed_at: datetime | None = None
+    total_files: int = 0
+    processed_files: int = 0
+    current_file: str | None = None
+    stats: IndexStats = field(default_factory=IndexStats)
+    errors: tuple[IndexError, ...] = ()
+
 
 class IndexJobManager:
     """Manages indexing jobs (in-memory, single-user)."""
 
     def __init__(self) -> None:
         """Initialize the job manager."""
-        self._current_job: dict[str, Any] | None = None
+        self._current_job: IndexJobSnapshot | None = None
         self._lock = threading.Lock()
 
-    def get_current_job(self) -> dict[str, Any] | None:
+    def get_current_job(self) -> IndexJobSnapshot | None:
         """Get the current running job, if any."""
         with self._lock:
             return self._current_job
@@ -38,9 +64,9 @@ class IndexJobManager:
     def is_busy(self) -> bool:
         """Check if an indexing job is currently running."""
         with self._lock:
-            return self._current_job is not None and self._current_job.get("status") == "running"
+            return self._current_job is not None and self._current_job.status == "running"
 
-    def start_job(self, path: str, project: str, recursive: bool) -> dict[str, Any]:
+    def start_job(self, path: str, project: str, recursive: bool) -> IndexJobSnapshot:
         """Start a new indexing job.
 
         Args:
@@ -49,34 +75,24 @@ class IndexJobManager:
             recursive: Whether to index recursively.
 
         Returns:
-            Job information dict.
+            Snapshot of the new job.
 
         Raises:
             ValueError: If a job is already running.
         """
         with self._lock:
-            if self._current_job and self._current_job.get("status") == "running":
-                raise ValueError(self._current_job["job_id"])
-
-            job_id = f"idx_{uuid.uuid4().hex[:8]}"
-            self._current_job = {
-                "job_id": job_id,
-                "status": "running",
-                "path": path,
-                "project": project,
-                "recursive": recursive,
-                "started_at": datetime.now(UTC),
-                "completed_at": None,
-                "progress": {
-                    "total_files": 0,
-                    "processed_files": 0,
-                    "percent": 0,
-                    "current_file": None,
-                },
-                "stats": {"documents": 0, "chunks": 0, "skipped": 0, "errors": 0},
-                "errors": [],
-            }
-            return self._current_job.copy()
+            if self._current_job and self._current_job.status == "running":
+                raise ValueError(self._current_job.job_id)
+
+            self._current_job = IndexJobSnapshot(
+                job_id=f"idx_{uuid.uuid4().hex[:8]}",
+                status="running",
+                path=path,
+                project=project,
+                recursive=recursive,
+                started_at=datetime.now(UTC),
+            )
+            return self._current_job
 
     def update_progress(
         self,
@@ -92,28 +108,30 @@ class IndexJobManager:
             current_file: Currently processing file.
         """
         with self._lock:
-            if not self._current_job:
+            job = self._current_job
+            if not job:
                 return
 
-            if total_files is not None:
-                self._current_job["progress"]["total_files"] = total_files
-            if processed_files is not None:
-                self._current_job["progress"]["processed_files"] = processed_files
-            if current_file is not None:
-                self._current_job["progress"]["current_file"] = current_file
-
-            # Recalculate percent
-            total = self._current_job["progress"]["total_files"]
-            processed = self._current_job["progress"]["processed_files"]
-            if total > 0:
-                self._current_job["progress"]["percent"] = int((processed / total) * 100)
+            self._current_job = replace(
+                job,
+                total_files=job.total_files if total_files is None else total_files,
+                processed_files=(
+                    job.processed_files if processed_files is None else processed_files
+                ),
+                current_file=job.current_file if current_file is None else current_file,
+            )
 
     def set_stats(self, stats: dict[str, int]) -> None:
         """Store cumulative stats for the job."""
-
+        job_stats = IndexStats.model_construct(
+            documents=stats.get("documents", 0),
+            chunks=stats.get("chunks", 0),
+            skipped=stats.get("skipped", 0),
+            errors=stats.get("errors", 0),
+        )
         with self._lock:
             if self._current_job:
-                self._current_job["stats"] = stats
+                self._current_job = replace(self._current_job, stats=job_stats)
 
     def add_error(self, file: str, error: str) -> None:
         """Add an error to the job.
@@ -124,7 +142,13 @@ class IndexJobManager:
         """
         with self._lock:
             if self._current_job:
-                self._current_job["errors"].append({"file": file, "error": error})
+                self._current_job = replace(
+                    self._current_job,
+                    errors=(
+                        *self._current_job.errors,
+                        IndexError.model_construct(file=file, error=error),
+                    ),
+                )
 
     def complete_job(self, status: str = "completed") -> None:
         """Mark the job as complete.
@@ -134,21 +158,22 @@ class IndexJobManager:
         """
         with self._lock:
             if self._current_job:
-                self._current_job["status"] = status
-                self._current_job["completed_at"] = datetime.now(UTC)
+                self._current_job = replace(
+                    self._current_job, status=status, completed_at=datetime.now(UTC)
+                )
 
-    def get_job(self, job_id: str) -> dict[str, Any] | None:
+    def get_job(self, job_id: str) -> IndexJobSnapshot | None:
         """Get a job by ID.
 
         Args:
             job_id: Job ID to look up.
 
         Returns:
-            Job information or None.
+            Job snapshot or None.
         """
         with self._lock:
-            if self._current_job and self._current_job["job_id"] == job_id:
-                return self._current_job.copy()
+            if self._current_job and self._current_job.job_id == job_id:
+                return self._current_job
             return None
 
 
@@ -185,14 +210,19 @@ def _run_index_job(path: str, project: str, recursive: bool) -> None:  # noqa: A
         manager.update_progress(total_files=total_files)
 
         processed_files = 0
+        last_file: Path | None = None
 
         def report_progress(file_path: Path) -> None:
-            nonlocal processed_files
+            nonlocal processed_files, last_file
             processed_files += 1
-            manager.update_progress(
-                processed_files=processed_files,
-                current_file=str(file_path),
-            )
+            last_file = file_path
+            # Publish the first file and the end of every batch to keep lock traffic
+            # off the per-file hot path without leaving small jobs at 0%.
+            if processed_files == 1 or processed_files % PROGRESS_UPDATE_INTERVAL == 0:
+                manager.update_progress(
+                    processed_files=processed_files,
+                    current_file=str(file_path),
+                )
 
         stats = index_paths(
             [target_path],
@@ -200,11 +230,38 @@ def _run_index_job(path: str, project: str, recursive: bool) -> None:  # noqa: A
             language="en",
             progress_callback=report_progress,
         )
+        manager.update_progress(
+            processed_files=processed_files,
+            current_file=str(last_file) if last_file is not None else None,
+        )
         manager.set_stats(stats)
         manager.complete_job("completed")
     except Exception as e:
         manager.add_error(path, str(e))
         manager.complete_job("failed")
+    finally:
+        invalidate_fix_queue_cache()
+        invalidate_projects_cache()
+
+
+def _job_response(job: IndexJobSnapshot, *, status: str | None = None) -> IndexResponse:
+    """Build an API response from a job snapshot without revalidating it."""
+    return IndexResponse.model_construct(
+        job_id=job.job_id,
+        status=status or job.status,
+        path=job.path,
+        project=job.project,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        progress=IndexProgress.model_construct(
+            total_files=job.total_files,
+            processed_files=job.processed_files,
+            percent=int(job.processed_files * 100 / job.total_files) if job.total_files else 0,
+            current_file=job.current_file,
+        ),
+        errors=list(job.errors),
+        stats=job.stats,
+    )
 
 
 @router.post("/index", response_model=IndexResponse)
@@ -239,16 +296,7 @@ def start_index_job(request: IndexRequest) -> IndexResponse:
     )
     thread.start()
 
-    return IndexResponse(
-        job_id=job["job_id"],
-        status="started",
-        path=job["path"],
-        project=job["project"],
-        started_at=job["started_at"],
-        progress=IndexProgress(**job["progress"]),
-        errors=[],
-        stats=IndexStats(**job.get("stats", {})),
-    )
+    return _job_response(job, status="started")
 
 
 @router.get("/index/{job_id}", response_model=IndexResponse)
@@ -270,14 +318,4 @@ def get_index_job(job_id: str) -> IndexResponse:
     if not job:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
-    return IndexResponse(
-        job_id=job["job_id"],
-        status=job["status"],
-        path=job["path"],
-        project=job["project"],
-        started_at=job["started_at"],
-        completed_at=job.get("completed_at"),
-        progress=IndexProgress(**job["progress"]),
-        errors=[IndexError(**e) for e in job.get("errors", [])],
-        stats=IndexStats(**job.get("stats", {})),
-    )
+    return _job_response(job)
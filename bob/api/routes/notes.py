@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
 
+from bob.api.fix_queue_cache import record_capture_write
 from bob.api.schemas import NoteCreateRequest, NoteCreateResponse
-from bob.api.templates import render_template, resolve_template_path
+from bob.api.templates import render_template, resolve_template_path, write_note
 from bob.api.write_permissions import ensure_allowed_write_path, ensure_scope_level
-from bob.config import get_config
+from bob.config import Config, get_config
 
 router = APIRouter()
 
@@ -26,10 +28,12 @@ def _resolve_target_path(target_path: str, vault_root: Path) -> Path:
     return vault_root / candidate
 
 
-@router.post("/notes/create", response_model=NoteCreateResponse)
-def create_note(request: NoteCreateRequest) -> NoteCreateResponse:
-    """Create a note from a canonical template."""
-    config = get_config()
+def _create_note(request: NoteCreateRequest, config: Config) -> NoteCreateResponse:
+    """Resolve, permission-check, render, and write a note.
+
+    Path resolution, permission checks (which may log a denial to SQLite), the
+    template read, and the vault write all block, so this runs in a worker thread.
+    """
     project = request.project or config.defaults.project
     language = request.language or config.defaults.language
     note_date = request.date or date.today()
@@ -54,13 +58,12 @@ def create_note(request: NoteCreateRequest) -> NoteCreateResponse:
 
     warnings: list[str] = []
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    if target_path.exists():
-        warnings.append("Existing note was overwritten.")
-
     try:
-        target_path.write_text(content, encoding="utf-8")
+        replaced = write_note(target_path, content)
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed to write note: {exc}") from exc
+    if replaced:
+        warnings.append("Existing note was overwritten.")
 
     return NoteCreateResponse(
         file_path=str(target_path),
@@ -68,3 +71,11 @@ def create_note(request: NoteCreateRequest) -> NoteCreateResponse:
         content=content,
         warnings=warnings,
     )
+
+
+@router.post("/notes/create", response_model=NoteCreateResponse)
+async def create_note(request: NoteCreateRequest) -> NoteCreateResponse:
+    """Create a note from a canonical template."""
+    response = await asyncio.to_thread(_create_note, request, get_config())
+    record_capture_write()
+    return response
@@ -6,7 +6,8 @@ import os
 import platform
 import shutil
 import subprocess
-from pathlib import Path
+from collections.abc import Callable
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -30,6 +31,56 @@ class OpenResponse(BaseModel):
     command: str | None = None
 
 
+EditorCommandFn = Callable[[str, int | None], list[str]]
+
+
+def _vscode_command(file_path: str, line: int | None) -> list[str]:
+    """Open in VS Code, jumping to the line when given."""
+    return ["code", "--goto", f"{file_path}:{line}" if line else file_path]
+
+
+def _cursor_command(file_path: str, line: int | None) -> list[str]:
+    """Open in Cursor, jumping to the line when given."""
+    return ["cursor", "--goto", f"{file_path}:{line}" if line else file_path]
+
+
+def _sublime_command(file_path: str, line: int | None) -> list[str]:
+    """Open in Sublime Text, jumping to the line when given."""
+    return ["subl", f"{file_path}:{line}" if line else file_path]
+
+
+def _line_flag_command(executable: str) -> EditorCommandFn:
+    """Build a command factory for editors that take a ``+LINE`` argument."""
+
+    def _command(file_path: str, line: int | None) -> list[str]:
+        if line:
+            return [executable, f"+{line}", file_path]
+        return [executable, file_path]
+
+    return _command
+
+
+EDITOR_COMMANDS: dict[str, EditorCommandFn] = {
+    "vscode": _vscode_command,
+    "code": _vscode_command,
+    "cursor": _cursor_command,
+    "vim": _line_flag_command("vim"),
+    "nvim": _line_flag_command("nvim"),
+    "neovim": _line_flag_command("nvim"),
+    "emacs": _line_flag_command("emacs"),
+    "sublime": _sublime_command,
+}
+
+# Editors probed on PATH, in order, when no preference or $EDITOR is set.
+DETECTED_EDITORS: tuple[tuple[str, EditorCommandFn], ...] = (
+    ("code", _vscode_command),
+    ("cursor", _cursor_command),
+    ("subl", _sublime_command),
+)
+
+_SYSTEM = platform.system()
+
+
 def _get_editor_command(editor: str | None, file_path: str, line: int | None) -> list[str]:
     """Get the command to open a file in an editor.
 
@@ -41,31 +92,13 @@ def _get_editor_command(editor: str | None, file_path: str, line: int | None) ->
     Returns:
         Command list to execute.
     """
-    location = f"{file_path}:{line}" if line else file_path
-
-    # Check for common editors
     if editor:
         editor = editor.lower()
-        if editor in ("vscode", "code"):
-            return ["code", "--goto", location]
-        elif editor == "cursor":
-            return ["cursor", "--goto", location]
-        elif editor in ("vim", "nvim", "neovim"):
-            if line:
-                return [editor if editor != "neovim" else "nvim", f"+{line}", file_path]
-            return [editor if editor != "neovim" else "nvim", file_path]
-        elif editor == "emacs":
-            if line:
-                return ["emacs", f"+{line}", file_path]
-            return ["emacs", file_path]
-        elif editor == "sublime":
-            return ["subl", location]
-        else:
-            # Try using the editor name directly
-            return [editor, file_path]
-
-    # Try to detect available editors
-    system = platform.system()
+        command_fn = EDITOR_COMMANDS.get(editor)
+        if command_fn is not None:
+            return command_fn(file_path, line)
+        # Try using the editor name directly
+        return [editor, file_path]
 
     # Check environment variable
     env_editor = os.environ.get("EDITOR") or os.environ.get("VISUAL")
@@ -75,29 +108,25 @@ def _get_editor_command(editor: str | None, file_path: str, line: int | None) ->
         return [env_editor, file_path]
 
     # Check for common editors in PATH
-    editors_to_try = [
-        ("code", ["code", "--goto", location]),
-        ("cursor", ["cursor", "--goto", location]),
-        ("subl", ["subl", location]),
-    ]
-
-    for cmd, full_cmd in editors_to_try:
+    for cmd, command_fn in DETECTED_EDITORS:
         if _command_exists(cmd):
-            return full_cmd
+            return command_fn(file_path, line)
 
     # Fallback to system default
-    if system == "Darwin":  # macOS
+    if _SYSTEM == "Darwin":  # macOS
         return ["open", file_path]
-    elif system == "Windows":
+    elif _SYSTEM == "Windows":
         return ["start", "", file_path]
     else:  # Linux and others
         return ["xdg-open", file_path]
 
 
+@lru_cache(maxsize=32)
 def _command_exists(cmd: str) -> bool:
     """Check if a command exists in PATH.
 
-    Uses shutil.which() for cross-platform compatibility.
+    Uses shutil.which() for cross-platform compatibility. Results are cached
+    for the life of the process, since editors are not installed mid-run.
     """
     return shutil.which(cmd) is not None
 
@@ -116,18 +145,19 @@ def open_file(request: OpenRequest) -> OpenResponse:
         Result indicating success or instructions for manual opening.
     """
     file_path = request.file_path
-    path = Path(file_path)
 
-    # Check if file exists
-    if not path.exists():
+    # Check if file exists (a single stat; same semantics as Path.exists())
+    try:
+        os.stat(file_path)
+    except (OSError, ValueError):
         raise HTTPException(
             status_code=404,
             detail=f"File not found: {file_path}",
-        )
+        ) from None
 
     # Get the command to open the file
     try:
-        cmd = _get_editor_command(request.editor, str(path.absolute()), request.line)
+        cmd = _get_editor_command(request.editor, os.path.abspath(file_path), request.line)
     except Exception as e:
         return OpenResponse(
             success=False,
@@ -11,7 +11,7 @@ router = APIRouter()
 
 
 @router.get("/permissions", response_model=PermissionsResponse)
-def permissions_status() -> PermissionsResponse:
+async def permissions_status() -> PermissionsResponse:
     """Return current permission scope and vault path configuration."""
     config = get_config()
     return PermissionsResponse(
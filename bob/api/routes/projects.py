@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+
 from fastapi import APIRouter
 
 from bob.api.schemas import ProjectListResponse, ProjectStats
@@ -9,35 +13,50 @@ from bob.db.database import get_database
 
 router = APIRouter()
 
+PROJECTS_CACHE_SECONDS = 10.0
+
+# (expires_at, response) for the last /projects listing. Index jobs invalidate it
+# from worker threads, so reads and writes go through the lock; the generation
+# keeps a listing that raced an invalidation from being stored.
+_projects_cache: tuple[float, ProjectListResponse] | None = None
+_projects_generation = 0
+_projects_lock = threading.Lock()
+
+
+def _collect_projects() -> list[ProjectStats]:
+    """Query per-project statistics from the database."""
+    return [ProjectStats(**stats) for stats in get_database().get_all_project_stats()]
+
+
+def invalidate_projects_cache() -> None:
+    """Drop the cached project listing after documents change."""
+    global _projects_cache, _projects_generation
+    with _projects_lock:
+        _projects_cache = None
+        _projects_generation += 1
+
 
 @router.get("/projects", response_model=ProjectListResponse)
-def list_projects() -> ProjectListResponse:
+async def list_projects() -> ProjectListResponse:
     """List all projects with their statistics.
 
     Returns:
         List of projects with document/chunk counts.
     """
-    db = get_database()
-
-    # Get all projects
-    cursor = db.conn.execute("SELECT DISTINCT project FROM documents ORDER BY project")
-    project_names = [row[0] for row in cursor.fetchall()]
-
-    projects = []
-    for name in project_names:
-        # Get stats for this project
-        stats = db.get_stats(project=name)
-
-        projects.append(
-            ProjectStats(
-                name=name,
-                document_count=stats.get("document_count", 0),
-                chunk_count=stats.get("chunk_count", 0),
-                source_types=stats.get("source_types", {}),
-            )
-        )
-
-    return ProjectListResponse(
+    global _projects_cache
+    now = time.monotonic()
+    with _projects_lock:
+        cached = _projects_cache
+        generation = _projects_generation
+    if cached and cached[0] > now:
+        return cached[1]
+
+    projects = await asyncio.to_thread(_collect_projects)
+    response = ProjectListResponse(
         projects=projects,
         total_projects=len(projects),
     )
+    with _projects_lock:
+        if _projects_generation == generation:
+            _projects_cache = (now + PROJECTS_CACHE_SECONDS, response)
+    return response
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
+from bob.api.fix_queue_cache import record_capture_write
 from bob.api.schemas import RoutineRequest, RoutineResponse, RoutineRetrieval
-from bob.api.templates import TEMPLATES_DIR, render_template
-from bob.api.utils import convert_result_to_source
+from bob.api.templates import TEMPLATES_DIR, render_template, write_note
+from bob.api.utils import convert_results_to_sources, model_json_response
 from bob.api.write_permissions import ensure_allowed_write_path, ensure_scope_level
-from bob.config import get_config
+from bob.config import Config, get_config
 from bob.retrieval.search import search
 from bob.utils import slugify
 
@@ -29,6 +32,7 @@ TRIP_PLAN_TEMPLATE = TEMPLATES_DIR / "trip-plan.md"
 
 TargetPathFn = Callable[[date, Path, RoutineRequest, str], Path]
 PlaceholderFn = Callable[[date, RoutineRequest], dict[str, str]]
+RoutineEndpoint = Callable[[RoutineRequest], Awaitable[Response]]
 
 
 @dataclass(frozen=True)
@@ -39,6 +43,15 @@ class RoutineQuery:
     query: str
     date_after_offset: timedelta | None = None
     date_before_offset: timedelta | None = None
+    missing_citations_warning: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-format the warning emitted when this bucket finds no sources."""
+        object.__setattr__(
+            self,
+            "missing_citations_warning",
+            f"No citations found for {self.name}; manual entry recommended.",
+        )
 
 
 @dataclass(frozen=True)
@@ -51,19 +64,26 @@ class RoutineAction:
     queries: tuple[RoutineQuery, ...]
     target_path_fn: TargetPathFn
     overwrite_warning: str
+    description: str
     placeholder_fn: PlaceholderFn | None = None
 
 
+@lru_cache(maxsize=256)
 def _resolve_date_after(target_date: date, offset: timedelta | None) -> datetime | None:
-    """Return the lower datetime bound relative to the target date."""
+    """Return the lower datetime bound relative to the target date.
+
+    Cached because every routine call resolves the same few offsets against the
+    same date; datetimes are immutable, so sharing them is safe.
+    """
     if offset is None:
         return None
     bound_date = target_date - offset
     return datetime.combine(bound_date, time.min)
 
 
+@lru_cache(maxsize=256)
 def _resolve_date_before(target_date: date, offset: timedelta | None) -> datetime | None:
-    """Return the upper datetime bound relative to the target date."""
+    """Return the upper datetime bound relative to the target date (cached like the lower bound)."""
     if offset is None:
         return None
     bound_date = target_date + offset
@@ -129,7 +149,7 @@ def _meeting_target_factory(suffix: str) -> TargetPathFn:
         fallback = f"meeting-{target_date.isoformat()}"
         slug = _derive_slug(base_slug, fallback)
         project_segment = _normalize_project_segment(project)
-        return vault_root / "meetings" / project_segment / f"{slug}-{suffix}.md"
+        return vault_root.joinpath("meetings", project_segment, f"{slug}-{suffix}.md")
 
     return _target_path
 
@@ -142,7 +162,7 @@ def _decision_target_path(
     fallback = request.title or f"decision-{target_date.isoformat()}"
     slug = _derive_slug(base_slug, fallback)
     filename = slug if slug.startswith("decision-") else f"decision-{slug}"
-    return vault_root / "decisions" / f"{filename}.md"
+    return vault_root.joinpath("decisions", f"{filename}.md")
 
 
 def _trip_target_path(
@@ -152,7 +172,7 @@ def _trip_target_path(
     base_slug = request.trip_slug or request.slug
     fallback = request.trip_name or f"trip-{target_date.isoformat()}"
     slug = _derive_slug(base_slug, fallback)
-    return vault_root / "trips" / slug / "debrief.md"
+    return vault_root.joinpath("trips", slug, "debrief.md")
 
 
 def _trip_plan_target_path(
@@ -162,7 +182,7 @@ def _trip_plan_target_path(
     base_slug = request.trip_slug or request.slug
     fallback = request.trip_name or f"trip-{target_date.isoformat()}"
     slug = _derive_slug(base_slug, fallback)
-    return vault_root / "trips" / slug / "plan.md"
+    return vault_root.joinpath("trips", slug, "plan.md")
 
 
 def _collect_retrieval(
@@ -186,25 +206,36 @@ def _collect_retrieval(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Search failed for {name}: {exc}") from exc
 
-    sources = [convert_result_to_source(result, idx + 1) for idx, result in enumerate(results)]
+    sources = convert_results_to_sources(results)
 
-    return RoutineRetrieval(name=name, query=query, sources=sources)
+    return RoutineRetrieval.model_construct(name=name, query=query, sources=sources)
 
 
 def _daily_target_path(
     target_date: date, vault_root: Path, _request: RoutineRequest, _project: str
 ) -> Path:
     """Build the vault path for the daily check-in note."""
-    return vault_root / "routines" / "daily" / f"{target_date.isoformat()}.md"
+    return vault_root.joinpath("routines", "daily", f"{target_date.isoformat()}.md")
+
+
+@lru_cache(maxsize=128)
+def _weekly_labels(target_date: date) -> tuple[str, str]:
+    """Return the ISO-week filename and Monday-Sunday range label for a date."""
+    iso_year, iso_week, _ = target_date.isocalendar()
+    week_start = target_date - timedelta(days=target_date.weekday())
+    week_end = week_start + timedelta(days=6)
+    return (
+        f"{iso_year}-W{iso_week:02d}.md",
+        f"{week_start.isoformat()} - {week_end.isoformat()}",
+    )
 
 
 def _weekly_target_path(
     target_date: date, vault_root: Path, _request: RoutineRequest, _project: str
 ) -> Path:
     """Build the vault path for the weekly review note."""
-    iso_year, iso_week, _ = target_date.isocalendar()
-    filename = f"{iso_year}-W{iso_week:02d}.md"
-    return vault_root / "routines" / "weekly" / filename
+    filename, _week_range = _weekly_labels(target_date)
+    return vault_root.joinpath("routines", "weekly", filename)
 
 
 def _daily_debrief_target_path(
@@ -215,16 +246,13 @@ def _daily_debrief_target_path(
 ) -> Path:
     """Build the vault path for the end-of-day debrief note."""
     filename = f"{target_date.isoformat()}-debrief.md"
-    return vault_root / "routines" / "daily" / filename
+    return vault_root.joinpath("routines", "daily", filename)
 
 
 def _weekly_placeholders(target_date: date, _request: RoutineRequest) -> dict[str, str]:
     """Provide week-specific placeholders for the weekly template."""
-    week_start = target_date - timedelta(days=target_date.weekday())
-    week_end = week_start + timedelta(days=6)
-    return {
-        "week_range": f"{week_start.isoformat()} - {week_end.isoformat()}",
-    }
+    _filename, week_range = _weekly_labels(target_date)
+    return {"week_range": week_range}
 
 
 ROUTINE_ACTIONS: dict[str, RoutineAction] = {
@@ -243,6 +271,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_daily_target_path,
         overwrite_warning="Existing daily check-in note was overwritten.",
+        description="Generate the daily check-in note with citations.",
     ),
     "daily-debrief": RoutineAction(
         name="daily-debrief",
@@ -264,6 +293,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_daily_debrief_target_path,
         overwrite_warning="Existing end-of-day debrief note was overwritten.",
+        description="Generate the end-of-day debrief note with citations.",
     ),
     "weekly-review": RoutineAction(
         name="weekly-review",
@@ -276,6 +306,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_weekly_target_path,
         overwrite_warning="Existing weekly review note was overwritten.",
+        description="Generate the weekly review note with citations.",
         placeholder_fn=_weekly_placeholders,
     ),
     "meeting-prep": RoutineAction(
@@ -294,6 +325,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_meeting_target_factory("prep"),
         overwrite_warning="Existing meeting prep note was overwritten.",
+        description="Generate a meeting prep note with retrieval-backed context.",
         placeholder_fn=_meeting_placeholders,
     ),
     "meeting-debrief": RoutineAction(
@@ -311,6 +343,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_meeting_target_factory("debrief"),
         overwrite_warning="Existing meeting debrief note was overwritten.",
+        description="Generate a meeting debrief note with open decisions highlighted.",
         placeholder_fn=_meeting_placeholders,
     ),
     "new-decision": RoutineAction(
@@ -323,6 +356,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_decision_target_path,
         overwrite_warning="Existing decision note was overwritten.",
+        description="Capture a new decision note with evidence and conflicting decisions.",
     ),
     "trip-debrief": RoutineAction(
         name="trip-debrief",
@@ -340,6 +374,7 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_trip_target_path,
         overwrite_warning="Existing trip debrief note was overwritten.",
+        description="Write a trip debrief note seeded from trip-related context.",
         placeholder_fn=_trip_placeholders,
     ),
     "trip-plan": RoutineAction(
@@ -353,124 +388,121 @@ ROUTINE_ACTIONS: dict[str, RoutineAction] = {
         ),
         target_path_fn=_trip_plan_target_path,
         overwrite_warning="Existing trip plan note was overwritten.",
+        description="Write a trip plan note seeded from previous trip learnings and packing lists.",
         placeholder_fn=_trip_plan_placeholders,
     ),
 }
 
 
-def _run_routine(action: RoutineAction, request: RoutineRequest) -> RoutineResponse:
-    """Execute the retrieval + templating + write cycle for a routine."""
-    config = get_config()
-    project = request.project or config.defaults.project
-    language = request.language or config.defaults.language
-    target_date = request.date or date.today()
-    top_k = request.top_k
-
-    warnings: list[str] = []
-
-    values = {
-        "project": project,
-        "date": target_date.isoformat(),
-        "language": language,
-    }
-    if action.placeholder_fn:
-        values.update(action.placeholder_fn(target_date, request))
-
-    vault_root = config.paths.vault
-    target_path = action.target_path_fn(target_date, vault_root, request, project)
-
+def _check_routine_permissions(
+    action: RoutineAction, project: str, target_path: Path, config: Config
+) -> None:
+    """Ensure the routine may write to its target path at the configured scope."""
     ensure_allowed_write_path(action.name, project, target_path, config)
     ensure_scope_level(action.name, project, target_path, config)
 
-    retrievals: list[RoutineRetrieval] = []
-    for query in action.queries:
-        date_after = _resolve_date_after(target_date, query.date_after_offset)
-        date_before = _resolve_date_before(target_date, query.date_before_offset)
-
-        retrieval = _collect_retrieval(
-            name=query.name,
-            query=query.query,
-            project=project,
-            top_k=top_k,
-            date_after=date_after,
-            date_before=date_before,
-        )
-        if not retrieval.sources:
-            warnings.append(f"No citations found for {query.name}; manual entry recommended.")
-        retrievals.append(retrieval)
 
+def _render_and_write_routine(
+    action: RoutineAction, target_path: Path, values: dict[str, str]
+) -> tuple[str, list[str]]:
+    """Render the routine template and write it, returning content and warnings."""
     content = render_template(
         template_path=action.template,
         values=values,
         source_tag=action.source_tag,
     )
 
+    warnings: list[str] = []
     target_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if target_path.exists():
-        warnings.append(action.overwrite_warning)
-
     try:
-        target_path.write_text(content, encoding="utf-8")
+        replaced = write_note(target_path, content)
     except OSError as exc:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to write {action.name} note: {exc}",
         ) from exc
-
-    return RoutineResponse(
-        routine=action.name,
-        file_path=str(target_path),
-        template=str(action.template),
-        content=content,
-        retrievals=retrievals,
-        warnings=warnings,
-    )
-
-
-@router.post("/routines/daily-checkin", response_model=RoutineResponse)
-def daily_checkin(request: RoutineRequest) -> RoutineResponse:
-    """Generate the daily check-in note with citations."""
-    return _run_routine(ROUTINE_ACTIONS["daily-checkin"], request)
-
-
-@router.post("/routines/weekly-review", response_model=RoutineResponse)
-def weekly_review(request: RoutineRequest) -> RoutineResponse:
-    """Generate the weekly review note with citations."""
-    return _run_routine(ROUTINE_ACTIONS["weekly-review"], request)
+    if replaced:
+        warnings.append(action.overwrite_warning)
+    return content, warnings
 
 
-@router.post("/routines/daily-debrief", response_model=RoutineResponse)
-def daily_debrief(request: RoutineRequest) -> RoutineResponse:
-    """Generate the end-of-day debrief note with citations."""
-    return _run_routine(ROUTINE_ACTIONS["daily-debrief"], request)
+async def _run_routine(action: RoutineAction, request: RoutineRequest) -> Response:
+    """Execute the retrieval + templating + write cycle for a routine."""
+    config = get_config()
+    project = request.project or config.defaults.project
+    language = request.language or config.defaults.language
+    target_date = request.date or date.today()
+    top_k = request.top_k
 
+    warnings: list[str] = []
 
-@router.post("/routines/meeting-prep", response_model=RoutineResponse)
-def meeting_prep(request: RoutineRequest) -> RoutineResponse:
-    """Generate a meeting prep note with retrieval-backed context."""
-    return _run_routine(ROUTINE_ACTIONS["meeting-prep"], request)
+    values = {
+        "project": project,
+        "date": target_date.isoformat(),
+        "language": language,
+    }
+    if action.placeholder_fn:
+        values.update(action.placeholder_fn(target_date, request))
 
+    target_path = action.target_path_fn(target_date, config.paths.vault, request, project)
+    # Permission checks resolve paths and may log a denial to SQLite; keep them off
+    # the event loop.
+    await asyncio.to_thread(_check_routine_permissions, action, project, target_path, config)
+
+    # The retrieval buckets are independent; overlap them so a routine waits on
+    # its slowest query rather than the sum of all of them.
+    retrievals: list[RoutineRetrieval] = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _collect_retrieval,
+                name=query.name,
+                query=query.query,
+                project=project,
+                top_k=top_k,
+                date_after=_resolve_date_after(target_date, query.date_after_offset),
+                date_before=_resolve_date_before(target_date, query.date_before_offset),
+            )
+            for query in action.queries
+        )
+    )
+    for query, retrieval in zip(action.queries, retrievals, strict=True):
+        if not retrieval.sources:
+            warnings.append(query.missing_citations_warning)
 
-@router.post("/routines/meeting-debrief", response_model=RoutineResponse)
-def meeting_debrief(request: RoutineRequest) -> RoutineResponse:
-    """Generate a meeting debrief note with open decisions highlighted."""
-    return _run_routine(ROUTINE_ACTIONS["meeting-debrief"], request)
+    # Template reads and the vault write block on disk; keep them off the event loop.
+    content, write_warnings = await asyncio.to_thread(
+        _render_and_write_routine, action, target_path, values
+    )
+    warnings.extend(write_warnings)
+    record_capture_write()
+
+    return model_json_response(
+        RoutineResponse.model_construct(
+            routine=action.name,
+            file_path=str(target_path),
+            template=str(action.template),
+            content=content,
+            retrievals=retrievals,
+            warnings=warnings,
+        )
+    )
 
 
-@router.post("/routines/new-decision", response_model=RoutineResponse)
-def new_decision(request: RoutineRequest) -> RoutineResponse:
-    """Capture a new decision note with evidence and conflicting decisions."""
-    return _run_routine(ROUTINE_ACTIONS["new-decision"], request)
+def _routine_endpoint(action: RoutineAction) -> RoutineEndpoint:
+    """Build the POST handler for a routine action."""
 
+    async def endpoint(request: RoutineRequest) -> Response:
+        return await _run_routine(action, request)
 
-@router.post("/routines/trip-debrief", response_model=RoutineResponse)
-def trip_debrief(request: RoutineRequest) -> RoutineResponse:
-    """Write a trip debrief note seeded from trip-related context."""
-    return _run_routine(ROUTINE_ACTIONS["trip-debrief"], request)
+    endpoint.__name__ = action.name.replace("-", "_")
+    endpoint.__doc__ = action.description
+    return endpoint
 
 
-@router.post("/routines/trip-plan", response_model=RoutineResponse)
-def trip_plan(request: RoutineRequest) -> RoutineResponse:
-    """Write a trip plan note seeded from previous trip learnings and packing lists."""
-    return _run_routine(ROUTINE_ACTIONS["trip-plan"], request)
+for _action in ROUTINE_ACTIONS.values():
+    router.add_api_route(
+        f"/routines/{_action.name}",
+        _routine_endpoint(_action),
+        methods=["POST"],
+        response_model=RoutineResponse,
+    )
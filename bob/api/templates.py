@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import HTTPException
@@ -13,6 +19,28 @@ PLACEHOLDER_PATTERN = re.compile(r"{{\s*([\w-]+)\s*}}")
 SOURCE_PATTERN = re.compile(r'(source:\s*")[^"]+(")')
 
 
+@dataclass(frozen=True, slots=True)
+class _CompiledTemplate:
+    """A template pre-split for single-pass rendering.
+
+    ``literals`` and ``keys`` alternate (literal, key, literal, ...). When the
+    template's ``source:`` line sits inside one literal, ``source_slot`` holds
+    that literal's index plus the text before and after the quoted value, so
+    overriding the source is a string splice rather than a regex pass.
+    """
+
+    mtime_ns: int
+    literals: tuple[str, ...]
+    keys: tuple[str, ...]
+    source_slot: tuple[int, str, str] | None
+
+
+# Template path -> compiled template. Entries are re-read only when the file's
+# mtime changes.
+_TEMPLATE_CACHE: dict[Path, _CompiledTemplate] = {}
+
+
+@lru_cache(maxsize=64)
 def resolve_template_path(template: str) -> Path:
     """Resolve a template identifier to a file path."""
     name = template.strip()
@@ -30,18 +58,104 @@ def resolve_template_path(template: str) -> Path:
     return path
 
 
-def render_template(template_path: Path, values: dict[str, str], source_tag: str | None) -> str:
-    """Render a template with placeholder values and optional source override."""
-    if not template_path.exists():
-        raise HTTPException(status_code=500, detail="Template not found")
+def _compile_template(raw: str, mtime_ns: int) -> _CompiledTemplate:
+    """Split raw template text into literals, placeholder keys, and the source slot."""
+    literals: list[str] = []
+    offsets: list[int] = []
+    keys: list[str] = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(raw):
+        literals.append(raw[position : match.start()])
+        offsets.append(position)
+        keys.append(match.group(1))
+        position = match.end()
+    literals.append(raw[position:])
+    offsets.append(position)
+
+    source_slot = None
+    source = SOURCE_PATTERN.search(raw)
+    if source is not None:
+        for index, (literal, offset) in enumerate(zip(literals, offsets, strict=True)):
+            if offset <= source.start() and source.end() <= offset + len(literal):
+                source_slot = (
+                    index,
+                    literal[: source.end(1) - offset],
+                    literal[source.start(2) - offset :],
+                )
+                break
+
+    return _CompiledTemplate(mtime_ns, tuple(literals), tuple(keys), source_slot)
 
-    raw = template_path.read_text(encoding="utf-8")
 
-    def replace(match: re.Match[str]) -> str:
-        key = match.group(1)
-        return values.get(key, "")
+def _load_template(template_path: Path) -> _CompiledTemplate:
+    """Return the compiled template, re-reading it only when its mtime changes."""
+    try:
+        mtime = template_path.stat().st_mtime_ns
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail="Template not found") from exc
 
-    rendered = PLACEHOLDER_PATTERN.sub(replace, raw)
-    if source_tag is not None:
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached.mtime_ns == mtime:
+        return cached
+
+    compiled = _compile_template(template_path.read_text(encoding="utf-8"), mtime)
+    _TEMPLATE_CACHE[template_path] = compiled
+    return compiled
+
+
+def render_template(template_path: Path, values: dict[str, str], source_tag: str | None) -> str:
+    """Render a template with placeholder values and optional source override."""
+    template = _load_template(template_path)
+    literals = template.literals
+    slot = template.source_slot if source_tag is not None else None
+    if slot is not None:
+        index, head, tail = slot
+        literals = (*literals[:index], f"{head}{source_tag}{tail}", *literals[index + 1 :])
+
+    pieces = [literals[0]]
+    for key, literal in zip(template.keys, literals[1:], strict=True):
+        pieces.append(values.get(key, ""))
+        pieces.append(literal)
+    rendered = "".join(pieces)
+    if source_tag is not None and slot is None:
+        # The source line spans a placeholder (or is absent); fall back to a regex pass.
         rendered = SOURCE_PATTERN.sub(rf"\1{source_tag}\2", rendered, count=1)
     return rendered
+
+
+def write_note(target_path: Path, content: str) -> bool:
+    """Write rendered note content, returning True when an existing note was replaced.
+
+    New notes are created with an exclusive open, so the common case needs no
+    separate existence check. Overwrites go through a uniquely named sibling temp
+    file that takes the original's permissions and is renamed over the target, so
+    readers (and the indexer) never see a half-written version of an existing note.
+    """
+    data = content.encode("utf-8")
+    try:
+        handle = target_path.open("xb")
+    except FileExistsError:
+        pass
+    else:
+        try:
+            with handle:
+                handle.write(data)
+        except OSError:
+            target_path.unlink(missing_ok=True)
+            raise
+        return False
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=target_path.parent, prefix=f".{target_path.name}.", suffix=".tmp"
+    )
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        with contextlib.suppress(OSError):
+            shutil.copymode(target_path, temp_path)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
@@ -4,42 +4,24 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
+from fastapi import Response
+from pydantic import BaseModel
+
 from bob.answer.formatter import get_date_confidence, is_outdated
 from bob.api.schemas import Source, SourceLocator
 from bob.retrieval.search import SearchResult
 
+# Date confidence levels ordered from least to most trustworthy.
+_CONFIDENCE_PRIORITY = {"UNKNOWN": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3}
+
 
 def build_locator(result: SearchResult) -> SourceLocator:
-    """Build a SourceLocator from a SearchResult's locator metadata."""
-    lv = result.locator_value or {}
-    return SourceLocator(
-        type=result.locator_type,
-        heading=lv.get("heading"),
-        start_line=lv.get("start_line"),
-        end_line=lv.get("end_line"),
-        page=lv.get("page"),
-        total_pages=lv.get("total_pages"),
-        paragraph_index=lv.get("paragraph_index"),
-        sheet_name=lv.get("sheet_name"),
-        row_count=lv.get("row_count"),
-        section=lv.get("section"),
-        **{
-            k: v
-            for k, v in lv.items()
-            if k
-            not in {
-                "heading",
-                "start_line",
-                "end_line",
-                "page",
-                "total_pages",
-                "paragraph_index",
-                "sheet_name",
-                "row_count",
-                "section",
-            }
-        },
-    )
+    """Build a SourceLocator from a SearchResult's locator metadata.
+
+    Known locator keys map onto the model's optional fields and any other keys
+    are kept as extras, so the metadata dict is passed through in one call.
+    """
+    return SourceLocator(type=result.locator_type, **(result.locator_value or {}))
 
 
 def convert_result_to_source(result: SearchResult, index: int) -> Source:
@@ -47,9 +29,8 @@ def convert_result_to_source(result: SearchResult, index: int) -> Source:
     confidence = get_date_confidence(result.source_date)
     outdated_flag = is_outdated(result.source_date)
 
-    snippet = result.content[:500]
-    if len(result.content) > 500:
-        snippet += "..."
+    content = result.content
+    snippet = content if len(content) <= 500 else f"{content[:500]}..."
 
     return Source(
         id=index,
@@ -68,12 +49,34 @@ def convert_result_to_source(result: SearchResult, index: int) -> Source:
     )
 
 
+def convert_results_to_sources(results: Iterable[SearchResult]) -> list[Source]:
+    """Convert ranked search results to Sources numbered from 1."""
+    return [convert_result_to_source(result, idx) for idx, result in enumerate(results, start=1)]
+
+
 def compute_overall_confidence(sources: Iterable[Source]) -> str | None:
-    """Return the minimum date confidence level among all sources."""
-    source_list = list(sources)
-    if not source_list:
-        return None
-
-    priority = {"UNKNOWN": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3}
-    lowest = min(source_list, key=lambda s: priority.get(s.date_confidence, 0))
-    return lowest.date_confidence
+    """Return the minimum date confidence level among all sources.
+
+    Single pass that stops at the first ``UNKNOWN`` (or unrecognized) level,
+    since nothing can rank lower.
+    """
+    lowest_priority = len(_CONFIDENCE_PRIORITY)
+    lowest: str | None = None
+    for source in sources:
+        priority = _CONFIDENCE_PRIORITY.get(source.date_confidence, 0)
+        if priority < lowest_priority:
+            lowest_priority = priority
+            lowest = source.date_confidence
+            if priority == 0:
+                break
+    return lowest
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to JSON with pydantic-core.
+
+    FastAPI would otherwise re-validate the returned model against the route's
+    ``response_model`` and encode the resulting dict with ``json.dumps``; the
+    route keeps ``response_model`` for the OpenAPI schema only.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import HTTPException
 
+from bob.api.fix_queue_cache import invalidate_fix_queue_cache
 from bob.config import Config
 from bob.db.database import get_database
 
@@ -13,13 +16,25 @@ TEMPLATE_WRITE_SCOPE = 3
 CONNECTOR_WRITE_SCOPE = 2
 
 
+def _allowed_directory_key(config: Config) -> tuple[Path, tuple[str, ...], str]:
+    """Return the cache key that allowed directory resolution depends on."""
+    return config.paths.vault, tuple(config.permissions.allowed_vault_paths), os.getcwd()
+
+
 def resolve_allowed_directories(config: Config) -> list[Path]:
     """Resolve configured allowed vault paths into absolute directories."""
-    cwd = Path.cwd()
-    vault_root = config.paths.vault.resolve()
+    return list(_resolve_allowed_directories(*_allowed_directory_key(config)))
+
+
+@lru_cache(maxsize=32)
+def _resolve_allowed_directories(
+    vault: Path, entries: tuple[str, ...], cwd: str
+) -> tuple[Path, ...]:
+    """Resolve allowed directories once per vault, path list, and working directory."""
+    vault_root = vault.resolve()
     allowed_dirs: set[Path] = set()
 
-    for entry in config.permissions.allowed_vault_paths:
+    for entry in entries:
         candidate = Path(entry)
         if candidate.is_absolute():
             allowed_dirs.add(candidate.resolve())
@@ -31,9 +46,19 @@ def resolve_allowed_directories(config: Config) -> list[Path]:
 
         relative = Path(*parts) if parts else Path(".")
         allowed_dirs.add((vault_root / relative).resolve())
-        allowed_dirs.add((cwd / candidate).resolve())
+        allowed_dirs.add((Path(cwd) / candidate).resolve())
 
-    return list(allowed_dirs)
+    return tuple(allowed_dirs)
+
+
+@lru_cache(maxsize=32)
+def _allowed_prefixes(vault: Path, entries: tuple[str, ...], cwd: str) -> tuple[str, ...]:
+    """Return allowed directories as normalized string prefixes ending in a separator."""
+    prefixes = []
+    for dir_path in _resolve_allowed_directories(vault, entries, cwd):
+        prefix = os.path.normcase(os.fspath(dir_path))
+        prefixes.append(prefix if prefix.endswith(os.sep) else prefix + os.sep)
+    return tuple(prefixes)
 
 
 def _log_permission_denial(
@@ -60,6 +85,7 @@ def _log_permission_denial(
         )
     except Exception:
         return
+    invalidate_fix_queue_cache()
 
 
 def ensure_allowed_write_path(
@@ -71,12 +97,14 @@ def ensure_allowed_write_path(
     required_scope_level: int = TEMPLATE_WRITE_SCOPE,
 ) -> None:
     """Validate that a write stays within allowed vault directories."""
-    resolved_target = target_path.resolve()
-    allowed_dirs = resolve_allowed_directories(config)
-    if any(resolved_target.is_relative_to(dir_path) for dir_path in allowed_dirs):
+    key = _allowed_directory_key(config)
+    # Appending a separator lets the target match its own directory as well as
+    # anything beneath it, with one str.startswith over all prefixes.
+    resolved_target = os.path.normcase(os.path.realpath(target_path)) + os.sep
+    if resolved_target.startswith(_allowed_prefixes(*key)):
         return
 
-    allowed_paths = [str(dir_path) for dir_path in allowed_dirs]
+    allowed_paths = [str(dir_path) for dir_path in _resolve_allowed_directories(*key)]
     _log_permission_denial(
         action_name=action_name,
         project=project,
@@ -17,17 +17,11 @@ from rich.logging import RichHandler
 
 from bob import __version__
 from bob.config import get_config
-from bob.watchlist import (
-    WatchlistEntry,
-    add_watchlist_entry,
-    get_watchlist_path,
-    load_watchlist,
-    remove_watchlist_entry,
-)
 
 console = Console()
 
 _DURATION_PATTERN = re.compile(r"^(?P<value>\d+)\s*(?P<unit>[dwmy])?$", re.IGNORECASE)
+_DURATION_MULTIPLIERS = {"d": 1, "w": 7, "m": 30, "y": 365}
 
 
 def parse_duration_to_days(raw: str) -> int:
@@ -39,8 +33,20 @@ def parse_duration_to_days(raw: str) -> int:
     unit = (match.group("unit") or "d").lower()
     if value <= 0:
         raise click.UsageError("Duration must be greater than zero.")
-    multipliers = {"d": 1, "w": 7, "m": 30, "y": 365}
-    return value * multipliers[unit]
+    return value * _DURATION_MULTIPLIERS[unit]
+
+
+def _print_json(data: object) -> None:
+    """Write JSON output straight to stdout.
+
+    Going through ``console.print`` would parse Rich markup inside values and
+    soft-wrap long strings, corrupting the JSON. The document is encoded before
+    anything is written, so a value that fails to serialize leaves stdout empty
+    rather than holding half a JSON document.
+    """
+    import json
+
+    sys.stdout.write(json.dumps(data, indent=2) + "\n")
 
 
 def setup_logging() -> None:
@@ -126,6 +132,7 @@ def index(
     PATHS: One or more file or directory paths to index.
     """
     from bob.index import index_paths
+    from bob.watchlist import get_watchlist_path, load_watchlist
 
     config = get_config()
     project = project or config.defaults.project
@@ -234,6 +241,7 @@ def watchlist_group() -> None:
 def watchlist_add(path: str, project: str | None, language: str | None) -> None:
     """Add a path to the watchlist."""
     from bob.ingest.git_docs import is_git_url, normalize_git_url
+    from bob.watchlist import WatchlistEntry, add_watchlist_entry
 
     candidate = normalize_git_url(path)
     if not is_git_url(candidate):
@@ -252,6 +260,8 @@ def watchlist_add(path: str, project: str | None, language: str | None) -> None:
 @watchlist_group.command("list")
 def watchlist_list() -> None:
     """List all watchlist targets."""
+    from bob.watchlist import get_watchlist_path, load_watchlist
+
     entries = load_watchlist()
     watchlist_path = get_watchlist_path()
 
@@ -280,6 +290,8 @@ def watchlist_list() -> None:
 @click.argument("path", type=click.Path())
 def watchlist_remove(path: str) -> None:
     """Remove a path from the watchlist."""
+    from bob.watchlist import remove_watchlist_entry
+
     if remove_watchlist_entry(path):
         console.print(f"[green]✓[/] Removed [cyan]{path}[/] from the watchlist.")
     else:
@@ -445,7 +457,6 @@ def ask(
     Project filter:   project:name
     Decision status:  decision:active|superseded|deprecated
     """
-    import json
     from datetime import datetime, timedelta
 
     from bob.answer import format_answer
@@ -509,7 +520,7 @@ def ask(
                     for r in results
                 ],
             }
-            console.print(json.dumps(json_results, indent=2))
+            _print_json(json_results)
         elif not results:
             console.print(f"[yellow]{NOT_FOUND_MESSAGE}[/]")
             console.print("\nTry:")
@@ -524,9 +535,7 @@ def ask(
 
     except Exception as e:
         if output_json:
-            import json
-
-            console.print(json.dumps({"error": str(e)}, indent=2))
+            _print_json({"error": str(e)})
             sys.exit(1)
         console.print(f"[red]Error during search:[/] {e}")
         if get_config().logging.level == "DEBUG":
@@ -581,7 +590,6 @@ def search(
         bob search deployment project:devops
         bob search "decision:active logging"
     """
-    import json
     from datetime import datetime, timedelta
 
     from bob.answer.formatter import get_date_confidence, is_outdated
@@ -658,7 +666,7 @@ def search(
                     for r in results
                 ],
             }
-            console.print(json.dumps(json_results, indent=2))
+            _print_json(json_results)
         elif not results:
             console.print("[yellow]No relevant documents found.[/]")
             console.print("\nTry:")
@@ -684,53 +692,58 @@ def search(
             if warning:
                 console.print(warning)
 
-            for i, r in enumerate(results, 1):
-                # Result header
-                date_str = r.source_date.strftime("%Y-%m-%d") if r.source_date else "unknown"
-                confidence = get_date_confidence(r.source_date)
-                outdated = is_outdated(r.source_date)
-
-                # Build header line with decision badge
-                header = f"[bold cyan]{i}.[/] [green]{r.source_path}[/]"
-                console.print(header, end="")
-
-                # Add decision badge if applicable
-                badge = format_decision_badge(r)
-                if badge:
-                    console.print(" ", end="")
-                    console.print(badge, end="")
-                console.print()  # Newline
-
-                console.print(f"   Score: {r.score:.3f} | Date: {date_str} | {confidence}")
-                if outdated:
-                    console.print("   [yellow]⚠️  May be outdated[/]")
-
-                # Locator
-                locator_parts = []
-                if r.locator_value.get("heading"):
-                    locator_parts.append(f'heading: "{r.locator_value["heading"]}"')
-                if r.locator_value.get("start_line"):
-                    end = r.locator_value.get("end_line", r.locator_value["start_line"])
-                    locator_parts.append(f"lines {r.locator_value['start_line']}-{end}")
-                if r.locator_value.get("page"):
-                    locator_parts.append(f"page {r.locator_value['page']}")
-                if locator_parts:
-                    console.print(f"   [dim]{' | '.join(locator_parts)}[/]")
-
-                # Content snippet with highlighted terms
-                snippet = r.content[:250].replace("\n", " ")
-                if len(r.content) > 250:
-                    snippet += "..."
-                highlighted = highlight_terms(snippet, query)
-                console.print("   ", end="")
-                console.print(highlighted)
-                console.print()
+            # Buffer the per-result prints and write them to the terminal once.
+            with console:
+                for i, r in enumerate(results, 1):
+                    # Result header
+                    date_str = r.source_date.strftime("%Y-%m-%d") if r.source_date else "unknown"
+                    confidence = get_date_confidence(r.source_date)
+                    outdated = is_outdated(r.source_date)
+
+                    # Build header line with decision badge
+                    header = f"[bold cyan]{i}.[/] [green]{r.source_path}[/]"
+                    console.print(header, end="")
+
+                    # Add decision badge if applicable
+                    badge = format_decision_badge(r)
+                    if badge:
+                        console.print(" ", end="")
+                        console.print(badge, end="")
+                    console.print()  # Newline
+
+                    console.print(f"   Score: {r.score:.3f} | Date: {date_str} | {confidence}")
+                    if outdated:
+                        console.print("   [yellow]⚠️  May be outdated[/]")
+
+                    # Locator
+                    lv = r.locator_value
+                    locator_parts = []
+                    heading = lv.get("heading")
+                    start_line = lv.get("start_line")
+                    page = lv.get("page")
+                    if heading:
+                        locator_parts.append(f'heading: "{heading}"')
+                    if start_line:
+                        end = lv.get("end_line", start_line)
+                        locator_parts.append(f"lines {start_line}-{end}")
+                    if page:
+                        locator_parts.append(f"page {page}")
+                    if locator_parts:
+                        console.print(f"   [dim]{' | '.join(locator_parts)}[/]")
+
+                    # Content snippet with highlighted terms
+                    content = r.content
+                    snippet = content[:250].replace("\n", " ")
+                    if len(content) > 250:
+                        snippet += "..."
+                    highlighted = highlight_terms(snippet, query)
+                    console.print("   ", end="")
+                    console.print(highlighted)
+                    console.print()
 
     except Exception as e:
         if output_json:
-            import json
-
-            console.print(json.dumps({"error": str(e)}, indent=2))
+            _print_json({"error": str(e)})
             sys.exit(1)
         console.print(f"[red]Error during search:[/] {e}")
         if get_config().logging.level == "DEBUG":
@@ -773,8 +786,6 @@ def extract_decisions(
     Scans indexed documents for decision-like statements (ADRs, "we decided to...",
     explicit decision markers) and stores them in the decisions table.
     """
-    import json
-
     from bob.extract.decisions import (
         clear_decisions,
         extract_decisions_from_project,
@@ -813,7 +824,7 @@ def extract_decisions(
                     for d in decisions
                 ],
             }
-            console.print(json.dumps(output, indent=2))
+            _print_json(output)
         else:
             if not decisions:
                 console.print("[yellow]No decisions found.[/]")
@@ -899,8 +910,6 @@ def list_decisions(
     Shows decisions stored in the database with their confidence scores,
     types, and source information.
     """
-    import json
-
     from rich.table import Table
 
     from bob.extract.decisions import get_decisions
@@ -932,7 +941,7 @@ def list_decisions(
                     for d in decisions
                 ],
             }
-            console.print(json.dumps(output, indent=2))
+            _print_json(output)
         else:
             if not decisions:
                 console.print("[yellow]No decisions found.[/]")
@@ -1010,8 +1019,6 @@ def show_decision(decision_id: int, output_json: bool) -> None:
 
     DECISION_ID: ID of the decision to show.
     """
-    import json
-
     from rich.panel import Panel
 
     from bob.extract.decisions import get_decision
@@ -1039,7 +1046,7 @@ def show_decision(decision_id: int, output_json: bool) -> None:
                 else None,
                 "extracted_at": decision.extracted_at.isoformat(),
             }
-            console.print(json.dumps(output, indent=2))
+            _print_json(output)
         else:
             # Color based on status
             status_color = {
@@ -1098,8 +1105,6 @@ def decision_history(decision_id: int, output_json: bool) -> None:
     Shows the full chain of decisions that have superseded each other,
     from oldest to newest.
     """
-    import json
-
     from bob.extract.decisions import (
         get_decision,
         get_supersession_chain,
@@ -1157,7 +1162,7 @@ def decision_history(decision_id: int, output_json: bool) -> None:
                     for d in successors
                 ],
             }
-            console.print(json.dumps(output, indent=2))
+            _print_json(output)
         else:
             console.print(f"[bold blue]Decision History for #{decision_id}[/]\n")
 
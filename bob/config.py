@@ -85,6 +85,9 @@ class HealthConfig(BaseModel):
     search_window_hours: int = 168
     ingestion_error_window_hours: int = 168
     ingestion_error_task_limit: int = 5
+    max_tasks_per_kind: int = 5
+    fix_queue_cache_seconds: float = 30.0
+    lint_refresh_seconds: float = 0.0
     min_searches_for_rate: int = 5
     staleness_buckets_days: list[int] = Field(default_factory=lambda: [90, 180, 365])
 
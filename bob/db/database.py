@@ -23,6 +23,26 @@ if TYPE_CHECKING:
     import numpy as np
     import numpy.typing as npt
 
+# Per-connection prepared statement cache. The default (128) is smaller than the
+# number of distinct statements the API and health metrics cycle through.
+STATEMENT_CACHE_SIZE = 256
+
+# Hoisted so every /projects listing reuses the same prepared statement.
+_PROJECT_STATS_SQL = """
+    SELECT d.project as project,
+           d.source_type as source_type,
+           COUNT(*) as document_count,
+           COALESCE(SUM(c.chunk_count), 0) as chunk_count
+    FROM documents d
+    LEFT JOIN (
+        SELECT document_id, COUNT(*) as chunk_count
+        FROM chunks
+        GROUP BY document_id
+    ) c ON c.document_id = d.id
+    GROUP BY d.project, d.source_type
+    ORDER BY d.project
+"""
+
 
 class Database:
     """SQLite database wrapper with vector search support."""
@@ -55,6 +75,7 @@ class Database:
         conn = sqlite3.connect(
             str(self.db_path),
             detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
         conn.row_factory = sqlite3.Row
 
@@ -680,6 +701,29 @@ class Database:
             "has_vec": self.has_vec,
         }
 
+    def get_all_project_stats(self) -> list[dict[str, Any]]:
+        """Return document, chunk, and source type counts for every project.
+
+        Returns:
+            One dict per project (ordered by name) with the same counts that
+            ``get_stats(project=...)`` reports.
+        """
+        cursor = self.conn.execute(_PROJECT_STATS_SQL)
+        projects: dict[str, dict[str, Any]] = {}
+        for row in cursor.fetchall():
+            entry = projects.get(row["project"])
+            if entry is None:
+                entry = projects[row["project"]] = {
+                    "name": row["project"],
+                    "document_count": 0,
+                    "chunk_count": 0,
+                    "source_types": {},
+                }
+            entry["document_count"] += int(row["document_count"])
+            entry["chunk_count"] += int(row["chunk_count"])
+            entry["source_types"][row["source_type"]] = int(row["document_count"])
+        return list(projects.values())
+
     def get_project_document_counts(self, project: str | None = None) -> list[dict[str, Any]]:
         """Return document counts grouped by project, optionally filtered."""
         params: list[Any] = []
@@ -991,11 +1035,11 @@ class Database:
         }
 
     def get_feedback_metrics(
-        self, *, project: str | None = None, window_hours: int = 48
+        self, *, project: str | None = None, window_hours: int = 48, limit: int = 5
     ) -> dict[str, Any]:
         """Summarize feedback for Fix Queue signals."""
         base_filters = "WHERE 1=1"
-        params: list[str] = []
+        params: list[Any] = []
         if project:
             base_filters += " AND project = ?"
             params.append(project)
@@ -1026,9 +1070,9 @@ class Database:
             GROUP BY question, project
             HAVING count > 1
             ORDER BY count DESC
-            LIMIT 5
+            LIMIT ?
             """,
-            params,
+            params + [limit],
         )
         repeated = [
             {
@@ -1142,25 +1186,30 @@ class Database:
     ) -> list[dict[str, Any]]:
         """Return counts of stale documents for the given age buckets."""
         buckets = sorted({int(days) for days in buckets_days if int(days) > 0})
-        results: list[dict[str, Any]] = []
-        for days in buckets:
-            params: list[Any] = [f"-{days} days"]
-            query = """
-                SELECT COUNT(*) as count
-                FROM documents
-                WHERE source_date IS NOT NULL
-                  AND source_date != ''
-                  AND datetime(source_date) <= datetime('now', ?)
-            """
-            if source_type:
-                query += " AND source_type = ?"
-                params.append(source_type)
-            if project:
-                query += " AND project = ?"
-                params.append(project)
-            count = self.conn.execute(query, params).fetchone()[0]
-            results.append({"days": days, "count": int(count)})
-        return results
+        if not buckets:
+            return []
+        # One scan counts every bucket instead of one query per bucket.
+        columns = ", ".join(
+            "COUNT(CASE WHEN datetime(source_date) <= datetime('now', ?) THEN 1 END)"
+            for _ in buckets
+        )
+        params: list[Any] = [f"-{days} days" for days in buckets]
+        query = f"""
+            SELECT {columns}
+            FROM documents
+            WHERE source_date IS NOT NULL
+              AND source_date != ''
+        """
+        if source_type:
+            query += " AND source_type = ?"
+            params.append(source_type)
+        if project:
+            query += " AND project = ?"
+            params.append(project)
+        row = self.conn.execute(query, params).fetchone()
+        return [
+            {"days": days, "count": int(count)} for days, count in zip(buckets, row, strict=True)
+        ]
 
     def get_stale_decision_buckets(
         self,
@@ -1170,25 +1219,94 @@ class Database:
     ) -> list[dict[str, Any]]:
         """Return counts of stale active decisions for the given age buckets."""
         buckets = sorted({int(days) for days in buckets_days if int(days) > 0})
-        results: list[dict[str, Any]] = []
-        for days in buckets:
-            params: list[Any] = [f"-{days} days"]
-            query = """
-                SELECT COUNT(*) as count
-                FROM decisions
-                JOIN chunks ON decisions.chunk_id = chunks.id
-                JOIN documents ON chunks.document_id = documents.id
-                WHERE decisions.status = 'active'
-                  AND decisions.decision_date IS NOT NULL
-                  AND decisions.decision_date != ''
-                  AND datetime(decisions.decision_date) <= datetime('now', ?)
-            """
-            if project:
-                query += " AND documents.project = ?"
-                params.append(project)
-            count = self.conn.execute(query, params).fetchone()[0]
-            results.append({"days": days, "count": int(count)})
-        return results
+        if not buckets:
+            return []
+        columns = ", ".join(
+            "COUNT(CASE WHEN datetime(decisions.decision_date) <= datetime('now', ?) THEN 1 END)"
+            for _ in buckets
+        )
+        params: list[Any] = [f"-{days} days" for days in buckets]
+        query = f"""
+            SELECT {columns}
+            FROM decisions
+            JOIN chunks ON decisions.chunk_id = chunks.id
+            JOIN documents ON chunks.document_id = documents.id
+            WHERE decisions.status = 'active'
+              AND decisions.decision_date IS NOT NULL
+              AND decisions.decision_date != ''
+        """
+        if project:
+            query += " AND documents.project = ?"
+            params.append(project)
+        row = self.conn.execute(query, params).fetchone()
+        return [
+            {"days": days, "count": int(count)} for days, count in zip(buckets, row, strict=True)
+        ]
+
+    def get_fix_queue_bundle(
+        self,
+        *,
+        project: str | None = None,
+        task_limit: int = 5,
+        search_window_hours: int = 168,
+        min_searches: int = 1,
+        staleness_buckets_days: list[int] | None = None,
+        ingestion_window_hours: int = 168,
+        ingestion_task_limit: int = 5,
+    ) -> dict[str, Any]:
+        """Collect every metric the Fix Queue needs in a single read transaction.
+
+        Args:
+            project: Optional project filter.
+            task_limit: Maximum rows returned per task-producing metric.
+            search_window_hours: Window for search hit-rate stats.
+            min_searches: Minimum searches before a project's hit rate counts.
+            staleness_buckets_days: Age buckets for stale notes and decisions.
+            ingestion_window_hours: Window for ingestion error metrics.
+            ingestion_task_limit: Maximum recent ingestion errors returned.
+
+        Returns:
+            Dict keyed by metric name with the same shapes as the individual getters.
+        """
+        buckets = staleness_buckets_days or []
+        conn = self.conn
+        # Hold one read snapshot across the aggregates so they agree with each
+        # other and SQLite does not re-acquire the shared lock per query.
+        owns_transaction = not conn.in_transaction
+        if owns_transaction:
+            conn.execute("BEGIN")
+        try:
+            return {
+                "feedback": self.get_feedback_metrics(project=project, limit=task_limit),
+                "metadata_deficits": self.get_documents_missing_metadata(
+                    project=project, limit=task_limit
+                ),
+                "metadata_total": self.get_missing_metadata_total(project=project),
+                "metadata_counts": self.get_missing_metadata_counts(project=project),
+                "permission_denials": self.get_permission_denial_metrics(
+                    project=project, limit=task_limit
+                ),
+                "project_counts": self.get_project_document_counts(project=project),
+                "search_stats": self.get_search_history_stats(
+                    window_hours=search_window_hours,
+                    min_count=min_searches,
+                    project=project,
+                ),
+                "stale_notes": self.get_stale_document_buckets(
+                    buckets_days=buckets, source_type="markdown", project=project
+                ),
+                "stale_decisions": self.get_stale_decision_buckets(
+                    buckets_days=buckets, project=project
+                ),
+                "ingestion_errors": self.get_ingestion_error_metrics(
+                    project=project,
+                    window_hours=ingestion_window_hours,
+                    limit=ingestion_task_limit,
+                ),
+            }
+        finally:
+            if owns_transaction:
+                conn.commit()
 
     # Coach Mode settings and suggestion log
 
@@ -7,10 +7,13 @@ from bob.health.priority import (
     priority_from_ratio,
     staleness_value,
 )
+from bob.health.refresher import CaptureLintRefresher, get_lint_refresher
 
 __all__ = [
+    "CaptureLintRefresher",
     "LintIssue",
     "collect_capture_lint_issues",
+    "get_lint_refresher",
     "invert_priority",
     "priority_from_count",
     "priority_from_ratio",
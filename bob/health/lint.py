@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -23,29 +26,38 @@ class LintIssue:
     file_path: Path
     message: str
     priority: int
+    project: str | None = None
 
 
 def collect_capture_lint_issues(
-    config: Config, *, limit: int = 10, project: str | None = None
+    config: Config, *, limit: int | None = 10, project: str | None = None
 ) -> list[LintIssue]:
-    """Scan allowed vault paths for capture hygiene issues."""
+    """Scan allowed vault paths for capture hygiene issues.
+
+    Pass ``limit=None`` to scan every file instead of stopping at the first ``limit`` issues.
+    """
     vault_root = config.paths.vault.resolve()
-    allowed_dirs = _resolve_allowed_directories(vault_root, config.permissions.allowed_vault_paths)
+    allowed_dirs = _resolve_allowed_directories(
+        vault_root, tuple(config.permissions.allowed_vault_paths), os.getcwd()
+    )
 
     issues: list[LintIssue] = []
     for path in _collect_markdown_files(allowed_dirs):
         issues.extend(_lint_file(path, project=project))
-        if len(issues) >= limit:
+        if limit is not None and len(issues) >= limit:
             return issues[:limit]
     return issues
 
 
-def _resolve_allowed_directories(vault_root: Path, entries: list[str]) -> list[Path]:
+@lru_cache(maxsize=32)
+def _resolve_allowed_directories(
+    vault_root: Path, entries: tuple[str, ...], cwd: str
+) -> tuple[Path, ...]:
     """Resolve allowed vault paths into absolute directories.
 
     Mirrors the routine write-path resolution so lint only scans expected vault roots.
+    Cached per vault, path list, and working directory, like the write-path resolver.
     """
-    cwd = Path.cwd()
     allowed_dirs: set[Path] = set()
 
     for entry in entries:
@@ -60,12 +72,12 @@ def _resolve_allowed_directories(vault_root: Path, entries: list[str]) -> list[P
 
         relative = Path(*parts) if parts else Path(".")
         allowed_dirs.add((vault_root / relative).resolve())
-        allowed_dirs.add((cwd / candidate).resolve())
+        allowed_dirs.add((Path(cwd) / candidate).resolve())
 
-    return list(allowed_dirs)
+    return tuple(allowed_dirs)
 
 
-def _collect_markdown_files(allowed_dirs: list[Path]) -> list[Path]:
+def _collect_markdown_files(allowed_dirs: Iterable[Path]) -> list[Path]:
     """Return a deterministic list of markdown files under allowed directories."""
     files: set[Path] = set()
     for directory in allowed_dirs:
@@ -88,6 +100,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
     frontmatter = _parse_frontmatter(lines)
     if project and not _frontmatter_project_matches(frontmatter, project):
         return []
+    note_project = _frontmatter_project(frontmatter)
     headings = _collect_headings(lines)
     issues: list[LintIssue] = []
 
@@ -97,6 +110,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
             LintIssue(
                 code="missing_metadata",
                 file_path=path,
+                project=note_project,
                 message=f"Missing metadata fields: {', '.join(missing_fields)}",
                 priority=3,
             )
@@ -113,6 +127,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
                 LintIssue(
                     code="missing_rationale",
                     file_path=path,
+                    project=note_project,
                     message=(
                         "Decision capture missing " + " / ".join(missing_rationale) + " section(s)."
                     ),
@@ -124,6 +139,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
                 LintIssue(
                     code="missing_rejected_options",
                     file_path=path,
+                    project=note_project,
                     message="Decision capture missing Rejected Options section.",
                     priority=2,
                 )
@@ -134,6 +150,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
             LintIssue(
                 code="missing_next_actions",
                 file_path=path,
+                project=note_project,
                 message="Meeting capture missing Next Actions section.",
                 priority=3,
             )
@@ -144,6 +161,7 @@ def _lint_file(path: Path, *, project: str | None = None) -> list[LintIssue]:
             LintIssue(
                 code="missing_next_actions",
                 file_path=path,
+                project=note_project,
                 message="Trip debrief missing Checklist Seeds section.",
                 priority=3,
             )
@@ -200,12 +218,17 @@ def _missing_metadata_fields(frontmatter: dict[str, Any]) -> list[str]:
     return missing
 
 
-def _frontmatter_project_matches(frontmatter: dict[str, Any], project: str) -> bool:
-    """Check whether frontmatter project matches the requested project."""
+def _frontmatter_project(frontmatter: dict[str, Any]) -> str | None:
+    """Return the normalized frontmatter project, if any."""
     value = frontmatter.get("project")
     if value is None:
-        return False
-    return str(value).strip() == project
+        return None
+    return str(value).strip()
+
+
+def _frontmatter_project_matches(frontmatter: dict[str, Any], project: str) -> bool:
+    """Check whether frontmatter project matches the requested project."""
+    return _frontmatter_project(frontmatter) == project
 
 
 def _is_path_segment(path: Path, segment: str) -> bool:
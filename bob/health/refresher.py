@@ -0,0 +1,136 @@
+"""Background refresh of capture lint results for the Fix Queue."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+
+from bob.config import Config
+from bob.health.lint import LintIssue, collect_capture_lint_issues
+
+
+class CaptureLintRefresher:
+    """Keeps capture lint results warm so the vault walk stays off the request path.
+
+    One unfiltered scan of the vault is cached and filtered by project on read, so
+    the cost of a refresh does not grow with the number of projects requested. The
+    first request scans synchronously; after that a daemon thread rescans only when
+    a capture write calls ``request_refresh``, plus on an interval when
+    ``health.lint_refresh_seconds`` is positive.
+    """
+
+    def __init__(self, limit: int = 10) -> None:
+        """Initialize an empty cache with no background thread.
+
+        Args:
+            limit: Maximum number of issues returned per read.
+        """
+        self._limit = limit
+        self._issues: list[LintIssue] | None = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the cached scan is replaced or dropped."""
+        with self._lock:
+            return self._version
+
+    def get(self, config: Config, project: str | None) -> list[LintIssue]:
+        """Return cached lint issues for a project, scanning on first use."""
+        with self._lock:
+            issues = self._issues
+            version = self._version
+        if issues is None:
+            issues = collect_capture_lint_issues(config, limit=None)
+            with self._lock:
+                # Fill the empty cache unless a clear or refresh landed meanwhile.
+                if self._version == version and self._issues is None:
+                    self._issues = issues
+        return self._filter(issues, project)
+
+    def refresh(self, config: Config) -> None:
+        """Rescan the vault and replace the cached issues."""
+        with self._lock:
+            version = self._version
+        issues = collect_capture_lint_issues(config, limit=None)
+        with self._lock:
+            # A scan that raced a clear may predate the write behind it; drop it so
+            # the next read rescans.
+            if self._version == version:
+                self._issues = issues
+                self._version += 1
+
+    def request_refresh(self) -> None:
+        """Rescan after a capture write.
+
+        Wakes the background thread, or drops the cache so the next request rescans
+        when no thread is running (e.g. outside the API server).
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._wake.set()
+        else:
+            self.clear()
+
+    def start(self, config: Config) -> None:
+        """Start the background refresher if it is not already running.
+
+        Args:
+            config: Configuration used for every background scan; a positive
+                ``health.lint_refresh_seconds`` adds periodic rescans.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(config,),
+            name="capture-lint-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresher."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def clear(self) -> None:
+        """Drop the cached lint results."""
+        with self._lock:
+            self._issues = None
+            self._version += 1
+
+    def _filter(self, issues: list[LintIssue], project: str | None) -> list[LintIssue]:
+        """Apply the project filter and issue limit to a cached scan."""
+        if project:
+            issues = [issue for issue in issues if issue.project == project]
+        return issues[: self._limit]
+
+    def _run(self, config: Config) -> None:
+        """Rescan once at startup, then on each capture write until stopped."""
+        interval_seconds = config.health.lint_refresh_seconds
+        timeout = interval_seconds if interval_seconds > 0 else None
+        self._wake.set()
+        while True:
+            self._wake.wait(timeout)
+            if self._stop.is_set():
+                return
+            self._wake.clear()
+            with contextlib.suppress(Exception):
+                self.refresh(config)
+
+
+# Global lint refresher instance
+_lint_refresher = CaptureLintRefresher()
+
+
+def get_lint_refresher() -> CaptureLintRefresher:
+    """Get the global capture lint refresher."""
+    return _lint_refresher
@@ -4,6 +4,13 @@ from __future__ import annotations
 
 import re
 
+# Byte translation for slugify: ASCII letters and digits map to their lowercase
+# form, every other byte becomes a hyphen.
+_SLUG_TABLE = bytes(
+    byte if chr(byte).isascii() and chr(byte).isalnum() else ord("-") for byte in range(256)
+).lower()
+_HYPHEN_RUNS = re.compile(r"-{2,}")
+
 
 def slugify(value: str, fallback: str = "") -> str:
     """Normalize a string into a filesystem-safe slug.
@@ -28,8 +35,8 @@ def slugify(value: str, fallback: str = "") -> str:
         >>> slugify("   ", fallback="untitled")
         'untitled'
     """
-    normalized = value.strip().lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", normalized)
-    slug = re.sub(r"-{2,}", "-", slug)
-    result = slug.strip("-")
-    return result or fallback
+    # Lowercase before encoding so case folding that yields ASCII (e.g. the
+    # Kelvin sign) is kept; any other non-ASCII character becomes "?" and then "-".
+    encoded = value.strip().lower().encode("ascii", "replace")
+    slug = _HYPHEN_RUNS.sub("-", encoded.translate(_SLUG_TABLE).decode("ascii"))
+    return slug.strip("-") or fallback
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pytest
 
+from bob.api.fix_queue_cache import reset_fix_queue_cache
+from bob.api.routes.projects import invalidate_projects_cache
 from bob.config import reset_config
 from bob.db.database import reset_database
 
@@ -71,6 +73,8 @@ def reset_globals():
     yield
     reset_config()
     reset_database()
+    reset_fix_queue_cache()
+    invalidate_projects_cache()
 
 
 @pytest.fixture
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -12,6 +14,7 @@ from fastapi.testclient import TestClient
 from bob.answer.constants import NOT_FOUND_MESSAGE
 from bob.api.app import create_app
 from bob.config import Config
+from bob.db.database import Database
 from bob.health.lint import LintIssue
 from bob.retrieval.search import SearchResult
 
@@ -37,6 +40,33 @@ def mock_database():
     return mock_db
 
 
+def _fix_queue_mock_db() -> MagicMock:
+    """Create a mock database whose Fix Queue bundle calls the mocked getters.
+
+    Every metric getter starts out empty; tests override the ones they exercise.
+    """
+    mock_db = MagicMock()
+    mock_db.get_fix_queue_bundle.side_effect = lambda **kwargs: Database.get_fix_queue_bundle(
+        mock_db, **kwargs
+    )
+    mock_db.get_feedback_metrics.return_value = {
+        "total": 0,
+        "counts": {},
+        "not_found_frequency": 0.0,
+        "repeated_questions": [],
+    }
+    mock_db.get_documents_missing_metadata.return_value = []
+    mock_db.get_missing_metadata_total.return_value = 0
+    mock_db.get_missing_metadata_counts.return_value = []
+    mock_db.get_permission_denial_metrics.return_value = {"total": 0, "counts": {}, "recent": []}
+    mock_db.get_ingestion_error_metrics.return_value = {"total": 0, "counts": {}, "recent": []}
+    mock_db.get_project_document_counts.return_value = []
+    mock_db.get_search_history_stats.return_value = []
+    mock_db.get_stale_document_buckets.return_value = []
+    mock_db.get_stale_decision_buckets.return_value = []
+    return mock_db
+
+
 @pytest.fixture
 def mock_coach_db():
     """Create a mock database with Coach Mode helpers."""
@@ -82,6 +112,17 @@ class TestHealthEndpoint:
         assert data["database"] == "error"
         assert data["indexed_documents"] == 0
 
+    def test_health_routes_registered_once(self):
+        """Each health route is registered by a single router."""
+        app = create_app()
+        health_routes = [
+            (route.path, method)
+            for route in app.routes
+            if getattr(route, "path", "").startswith("/health")
+            for method in getattr(route, "methods", set())
+        ]
+        assert len(health_routes) == len(set(health_routes))
+
 
 class TestFeedbackEndpoint:
     """Tests for POST /feedback."""
@@ -171,9 +212,17 @@ class TestHealthFixQueueEndpoint:
                 file_path=Path("/vault/decisions/decision-01.md"),
                 message="Decision capture missing Context section.",
                 priority=2,
-            )
+                project="docs",
+            ),
+            LintIssue(
+                code="missing_rationale",
+                file_path=Path("/vault/decisions/decision-02.md"),
+                message="Decision capture missing Context section.",
+                priority=2,
+                project="other",
+            ),
         ]
-        mock_db = MagicMock()
+        mock_db = _fix_queue_mock_db()
         mock_db.get_feedback_metrics.return_value = metrics
         mock_db.get_documents_missing_metadata.return_value = metadata
         mock_db.get_missing_metadata_total.return_value = 1
@@ -201,7 +250,7 @@ class TestHealthFixQueueEndpoint:
                 return_value=mock_db,
             ),
             patch(
-                "bob.api.routes.health.collect_capture_lint_issues",
+                "bob.health.refresher.collect_capture_lint_issues",
                 return_value=lint_issues,
             ) as mock_collect,
         ):
@@ -243,7 +292,8 @@ class TestHealthFixQueueEndpoint:
         assert mock_db.get_search_history_stats.call_args.kwargs["project"] == "docs"
         assert mock_db.get_stale_document_buckets.call_args.kwargs["project"] == "docs"
         assert mock_db.get_stale_decision_buckets.call_args.kwargs["project"] == "docs"
-        assert mock_collect.call_args.kwargs["project"] == "docs"
+        assert "/vault/decisions/decision-02.md" not in targets
+        assert mock_collect.call_args.kwargs["limit"] is None
 
     def test_fix_queue_priorities_favor_high_frequency(self, client: TestClient):
         metrics = {
@@ -255,7 +305,7 @@ class TestHealthFixQueueEndpoint:
             ],
         }
         permission_metrics = {"total": 0, "counts": {}, "recent": [], "window_hours": 48}
-        mock_db = MagicMock()
+        mock_db = _fix_queue_mock_db()
         mock_db.get_feedback_metrics.return_value = metrics
         mock_db.get_documents_missing_metadata.return_value = []
         mock_db.get_missing_metadata_total.return_value = 0
@@ -273,7 +323,7 @@ class TestHealthFixQueueEndpoint:
                 return_value=mock_db,
             ),
             patch(
-                "bob.api.routes.health.collect_capture_lint_issues",
+                "bob.health.refresher.collect_capture_lint_issues",
                 return_value=[],
             ),
         ):
@@ -292,6 +342,181 @@ class TestHealthFixQueueEndpoint:
         assert repeated_task["project"] == "docs"
         assert repeated_task["action"] == "run_query"
 
+    def test_fix_queue_ndjson_streams_signals_then_tasks(self, client: TestClient):
+        metrics = {
+            "total": 10,
+            "counts": {"didnt_answer": 9},
+            "not_found_frequency": 0.9,
+            "repeated_questions": [],
+        }
+        mock_db = _fix_queue_mock_db()
+        mock_db.get_feedback_metrics.return_value = metrics
+
+        with (
+            patch(
+                "bob.api.routes.health.get_database",
+                return_value=mock_db,
+            ),
+            patch(
+                "bob.health.refresher.collect_capture_lint_issues",
+                return_value=[],
+            ),
+        ):
+            response = client.get("/health/fix-queue.ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        kinds = [line["type"] for line in lines]
+        assert kinds == ["failure_signal"] * 10 + ["task"]
+        assert lines[0]["data"]["name"] == "not_found_frequency"
+        assert lines[-1]["data"]["target"] == "routines/daily-checkin"
+
+    def test_fix_queue_etag_and_cache(self, client: TestClient):
+        mock_db = _fix_queue_mock_db()
+
+        with (
+            patch("bob.api.routes.health.get_database", return_value=mock_db),
+            patch("bob.health.refresher.collect_capture_lint_issues", return_value=[]),
+            patch("bob.api.routes.feedback.get_database", return_value=mock_db),
+        ):
+            first = client.get("/health/fix-queue")
+            etag = first.headers["etag"]
+            cached = client.get("/health/fix-queue", headers={"If-None-Match": etag})
+            assert mock_db.get_feedback_metrics.call_count == 1
+
+            client.post("/feedback", json={"question": "Q?", "feedback_reason": "helpful"})
+            refreshed = client.get("/health/fix-queue")
+
+        assert first.status_code == 200
+        assert cached.status_code == 304
+        assert refreshed.status_code == 200
+        assert mock_db.get_feedback_metrics.call_count == 2
+
+    def test_fix_queue_if_none_match_uses_weak_comparison(self, client: TestClient):
+        mock_db = _fix_queue_mock_db()
+
+        with (
+            patch("bob.api.routes.health.get_database", return_value=mock_db),
+            patch("bob.health.refresher.collect_capture_lint_issues", return_value=[]),
+        ):
+            etag = client.get("/health/fix-queue").headers["etag"]
+            responses = {
+                header: client.get("/health/fix-queue", headers={"If-None-Match": header})
+                for header in (f"W/{etag}", f'"other", {etag}', "*", '"other"')
+            }
+
+        assert responses[f"W/{etag}"].status_code == 304
+        assert responses[f'"other", {etag}'].status_code == 304
+        assert responses["*"].status_code == 304
+        assert responses['"other"'].status_code == 200
+        assert responses[f"W/{etag}"].headers["etag"] == etag
+
+    def test_fix_queue_cache_invalidated_by_capture_writes(self, client: TestClient):
+        from bob.api.fix_queue_cache import record_capture_write
+        from bob.health.refresher import get_lint_refresher
+
+        mock_db = _fix_queue_mock_db()
+
+        with (
+            patch("bob.api.routes.health.get_database", return_value=mock_db),
+            patch("bob.health.refresher.collect_capture_lint_issues", return_value=[]),
+        ):
+            client.get("/health/fix-queue")
+            client.get("/health/fix-queue")
+            assert mock_db.get_feedback_metrics.call_count == 1
+
+            record_capture_write()
+            client.get("/health/fix-queue")
+            assert mock_db.get_feedback_metrics.call_count == 2
+
+            # A finished background rescan also retires responses built from the old scan.
+            get_lint_refresher().refresh(Config())
+            client.get("/health/fix-queue")
+            assert mock_db.get_feedback_metrics.call_count == 3
+
+    def test_capture_lint_refresher_filters_one_cached_scan(self):
+        from bob.health.refresher import CaptureLintRefresher
+
+        docs_issue = LintIssue(
+            code="missing_metadata",
+            file_path=Path("/vault/routines/daily.md"),
+            message="Missing metadata fields: source",
+            priority=3,
+            project="docs",
+        )
+        other_issue = LintIssue(
+            code="missing_metadata",
+            file_path=Path("/vault/routines/other.md"),
+            message="Missing metadata fields: source",
+            priority=3,
+            project="other",
+        )
+        refresher = CaptureLintRefresher()
+        config = Config()
+
+        with patch(
+            "bob.health.refresher.collect_capture_lint_issues",
+            return_value=[docs_issue, other_issue],
+        ) as mock_collect:
+            assert refresher.get(config, "docs") == [docs_issue]
+            assert refresher.get(config, "other") == [other_issue]
+            assert refresher.get(config, None) == [docs_issue, other_issue]
+            assert mock_collect.call_count == 1
+            assert mock_collect.call_args.kwargs == {"limit": None}
+
+            refresher.refresh(config)
+            assert mock_collect.call_count == 2
+            assert mock_collect.call_args.args == (config,)
+
+            refresher.request_refresh()
+            refresher.get(config, "docs")
+            assert mock_collect.call_count == 3
+
+    def test_capture_lint_refresher_discards_scan_that_raced_a_clear(self):
+        from bob.health.refresher import CaptureLintRefresher
+
+        refresher = CaptureLintRefresher()
+        config = Config()
+
+        def scan_while_note_written(*_args, **_kwargs):
+            refresher.clear()
+            return ["stale"]
+
+        with patch(
+            "bob.health.refresher.collect_capture_lint_issues",
+            side_effect=scan_while_note_written,
+        ):
+            assert refresher.get(config, None) == ["stale"]
+
+        with patch(
+            "bob.health.refresher.collect_capture_lint_issues", return_value=["fresh"]
+        ) as mock_collect:
+            assert refresher.get(config, None) == ["fresh"]
+            assert refresher.get(config, None) == ["fresh"]
+            assert mock_collect.call_count == 1
+
+    def test_capture_lint_refresher_thread_only_rescans_on_request(self):
+        from bob.health.refresher import CaptureLintRefresher
+
+        refresher = CaptureLintRefresher()
+        scanned = threading.Semaphore(0)
+
+        def scan(*_args, **_kwargs):
+            scanned.release()
+            return []
+
+        with patch("bob.health.refresher.collect_capture_lint_issues", side_effect=scan):
+            refresher.start(Config())
+            try:
+                assert scanned.acquire(timeout=5)
+                assert not scanned.acquire(timeout=0.2)
+
+                refresher.request_refresh()
+                assert scanned.acquire(timeout=5)
+            finally:
+                refresher.stop()
+
 
 class TestAskEndpoint:
     """Tests for POST /ask endpoint."""
@@ -1123,6 +1348,27 @@ class TestRoutinesEndpoint:
         mock_search.assert_not_called()
         mock_db.log_permission_denial.assert_called_once()
 
+    def test_allowed_path_does_not_match_sibling_prefix(self, tmp_path):
+        """A directory sharing a name prefix with an allowed path is still rejected."""
+        from fastapi import HTTPException
+
+        from bob.api.write_permissions import ensure_allowed_write_path
+
+        config = Config()
+        config.paths.vault = tmp_path
+        config.permissions.allowed_vault_paths = ["vault/routines"]
+
+        ensure_allowed_write_path("test", "test", tmp_path / "routines" / "note.md", config)
+        ensure_allowed_write_path("test", "test", tmp_path / "routines", config)
+        with (
+            patch("bob.api.write_permissions.get_database", return_value=MagicMock()),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            ensure_allowed_write_path(
+                "test", "test", tmp_path / "routines-archive" / "note.md", config
+            )
+        assert exc_info.value.status_code == 403
+
     def test_meeting_prep_requires_allowed_path(self, client: TestClient, tmp_path):
         """POST /routines/meeting-prep respects allowed vault paths."""
         config = Config()
@@ -1178,6 +1424,26 @@ class TestNotesEndpoint:
         body = target_path.read_text()
         assert 'project: "ops"' in body
         assert 'source: "template/decision"' in body
+        assert data["warnings"] == []
+
+    def test_notes_create_warns_when_overwriting(self, client: TestClient, tmp_path):
+        """POST /notes/create replaces an existing note and reports it."""
+        config = Config()
+        config.paths.vault = tmp_path
+        target_path = tmp_path / "decisions" / "decision-test.md"
+        target_path.parent.mkdir(parents=True)
+        target_path.write_text("stale")
+
+        with patch("bob.api.routes.notes.get_config", return_value=config):
+            response = client.post(
+                "/notes/create",
+                json={"template": "decision", "target_path": "decisions/decision-test.md"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["warnings"] == ["Existing note was overwritten."]
+        assert target_path.read_text() != "stale"
+        assert list(target_path.parent.glob(".decision-test.md.*.tmp")) == []
 
     def test_notes_create_requires_template_scope(self, client: TestClient, tmp_path):
         """POST /notes/create returns 403 when scope < 3."""
@@ -1322,23 +1588,67 @@ class TestProjectsEndpoint:
 
     def test_projects_returns_list(self, client: TestClient, mock_database: MagicMock):
         """Projects endpoint returns list of projects."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [("project1",), ("project2",)]
-        mock_database.conn.execute.return_value = mock_cursor
+        mock_database.get_all_project_stats.return_value = [
+            {
+                "name": "project1",
+                "document_count": 2,
+                "chunk_count": 5,
+                "source_types": {"markdown": 2},
+            },
+            {"name": "project2", "document_count": 1, "chunk_count": 0, "source_types": {"pdf": 1}},
+        ]
 
         with patch("bob.api.routes.projects.get_database", return_value=mock_database):
             response = client.get("/projects")
 
         assert response.status_code == 200
         data = response.json()
-        assert "projects" in data
-        assert "total_projects" in data
+        assert [project["name"] for project in data["projects"]] == ["project1", "project2"]
+        assert data["projects"][0]["chunk_count"] == 5
+        assert data["total_projects"] == 2
+
+    def test_projects_response_cached_until_invalidated(
+        self, client: TestClient, mock_database: MagicMock
+    ):
+        """Repeat listings reuse the cached response until the cache is dropped."""
+        from bob.api.routes.projects import invalidate_projects_cache
+
+        mock_database.get_all_project_stats.return_value = []
+
+        with patch("bob.api.routes.projects.get_database", return_value=mock_database):
+            client.get("/projects")
+            client.get("/projects")
+            assert mock_database.get_all_project_stats.call_count == 1
+
+            invalidate_projects_cache()
+            client.get("/projects")
+
+        assert mock_database.get_all_project_stats.call_count == 2
+
+    def test_projects_listing_that_raced_invalidation_is_not_cached(
+        self, client: TestClient, mock_database: MagicMock
+    ):
+        """A listing built while an index job invalidated the cache is not stored."""
+        from bob.api.routes.projects import invalidate_projects_cache
+
+        def stats_while_indexing():
+            invalidate_projects_cache()
+            return []
+
+        mock_database.get_all_project_stats.side_effect = stats_while_indexing
+
+        with patch("bob.api.routes.projects.get_database", return_value=mock_database):
+            client.get("/projects")
+            mock_database.get_all_project_stats.side_effect = None
+            mock_database.get_all_project_stats.return_value = []
+            client.get("/projects")
+            client.get("/projects")
+
+        assert mock_database.get_all_project_stats.call_count == 2
 
     def test_projects_empty_list(self, client: TestClient, mock_database: MagicMock):
         """Projects endpoint handles empty list."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
-        mock_database.conn.execute.return_value = mock_cursor
+        mock_database.get_all_project_stats.return_value = []
 
         with patch("bob.api.routes.projects.get_database", return_value=mock_database):
             response = client.get("/projects")
@@ -145,3 +145,7 @@ source: "template/decision"
     issues = collect_capture_lint_issues(config, limit=10, project="alpha")
     assert issues
     assert {issue.file_path for issue in issues} == {alpha_path}
+    assert {issue.project for issue in issues} == {"alpha"}
+
+    all_issues = collect_capture_lint_issues(config, limit=None)
+    assert {issue.project for issue in all_issues} == {"alpha", "beta"}
@@ -109,6 +109,36 @@ class TestDatabaseOperations:
         assert stats["chunk_count"] == 1
         assert "markdown" in stats["source_types"]
 
+    def test_get_all_project_stats_matches_per_project_stats(self, test_db):
+        for path, source_type, project in (
+            ("/a.md", "markdown", "alpha"),
+            ("/b.pdf", "pdf", "alpha"),
+            ("/c.md", "markdown", "beta"),
+        ):
+            doc_id = test_db.insert_document(
+                source_path=path,
+                source_type=source_type,
+                project=project,
+                content_hash=path,
+            )
+            for index in range(2 if project == "alpha" else 1):
+                test_db.insert_chunk(
+                    document_id=doc_id,
+                    content="chunk",
+                    locator_type="heading",
+                    locator_value={},
+                    chunk_index=index,
+                )
+
+        all_stats = test_db.get_all_project_stats()
+
+        assert [entry["name"] for entry in all_stats] == ["alpha", "beta"]
+        for entry in all_stats:
+            stats = test_db.get_stats(project=entry["name"])
+            assert entry["document_count"] == stats["document_count"]
+            assert entry["chunk_count"] == stats["chunk_count"]
+            assert entry["source_types"] == stats["source_types"]
+
     def test_stats_filter_by_project(self, test_db):
         test_db.insert_document(
             source_path="/a.md",
@@ -315,6 +345,19 @@ class TestDatabaseOperations:
             for entry in metrics["repeated_questions"]
         )
 
+    def test_feedback_metrics_repeated_question_limit(self, test_db):
+        for question in ("First?", "Second?", "Third?"):
+            for _ in range(2):
+                test_db.log_feedback(
+                    question=question,
+                    project="docs",
+                    answer_id=None,
+                    feedback_reason="didnt_answer",
+                )
+
+        metrics = test_db.get_feedback_metrics(window_hours=48, limit=2)
+        assert len(metrics["repeated_questions"]) == 2
+
     def test_stale_document_buckets(self, test_db):
         old_date = datetime.now() - timedelta(days=200)
         recent_date = datetime.now() - timedelta(days=10)
@@ -375,6 +418,26 @@ class TestDatabaseOperations:
         assert bucket_by_days[90] >= 1
         assert bucket_by_days[180] >= 1
 
+    def test_fix_queue_bundle_matches_individual_getters(self, test_db):
+        old_date = datetime.now() - timedelta(days=200)
+        recent_date = datetime.now() - timedelta(days=100)
+        for name, source_date in (("old", old_date), ("recent", recent_date)):
+            test_db.insert_document(
+                source_path=f"/{name}.md",
+                source_type="markdown",
+                project="docs",
+                content_hash=name,
+                source_date=source_date,
+            )
+
+        bundle = test_db.get_fix_queue_bundle(project="docs", staleness_buckets_days=[180, 90])
+
+        assert not test_db.conn.in_transaction
+        assert bundle["stale_notes"] == [{"days": 90, "count": 2}, {"days": 180, "count": 1}]
+        assert bundle["stale_decisions"] == [{"days": 90, "count": 0}, {"days": 180, "count": 0}]
+        assert bundle["metadata_total"] == test_db.get_missing_metadata_total(project="docs")
+        assert bundle["project_counts"] == test_db.get_project_document_counts(project="docs")
+
 
 class TestDecisionStorage:
     """Tests for decision storage operations."""